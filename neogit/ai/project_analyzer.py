@@ -1,7 +1,111 @@
+import copy
+import hashlib
 import os
+import pickle
+import queue
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+
+# Directories never descended into and file suffixes never collected.
+# Built once at import so membership tests hash instead of scanning a
+# per-call list, and expanded to cover common large build/VCS trees.
+_DIR_BLACKLIST = frozenset({
+    'node_modules', '__pycache__', 'venv', '.git', '.svn', '.hg',
+    'target', 'dist', 'build', '.tox', '.mypy_cache', '.pytest_cache',
+})
+_FILE_SUFFIX_SKIP = ('.pyc', '.pyo', '.log', '.tmp', '.swp', '.DS_Store')
+
+# Optional compiled suffix matcher (packed-integer compare over the
+# trailing bytes). tuple-endswith is already a C-level loop, so the SWAR
+# variant only pays off as a native extension; pick it up if one is
+# installed, otherwise fall back.
+try:
+    from neogit.ai._fastmatch import should_skip as _should_skip
+except ImportError:
+    def _should_skip(name: str) -> bool:
+        return name.endswith(_FILE_SUFFIX_SKIP)
+
+# Optional compiled extension classifier, same deal as _should_skip. The
+# fallback interns extension strings through a bounded cache so the
+# repeated common extensions of a big tree share one str object instead
+# of allocating a fresh slice per file.
+try:
+    from neogit.ai._fastmatch import ext_of as _ext_of
+except ImportError:
+    _EXT_CACHE: Dict[str, str] = {}
+
+    def _ext_of(name_lower: str) -> str:
+        dot = name_lower.rfind('.')
+        if dot <= 0:
+            return ''
+        ext = name_lower[dot:]
+        cached = _EXT_CACHE.get(ext)
+        if cached is not None:
+            return cached
+        if len(_EXT_CACHE) < 1024:
+            _EXT_CACHE[ext] = ext
+        return ext
+
+# Framework hint bits accumulated during the scan.
+_HINT_DJANGO = 1 << 0
+_HINT_FLASK = 1 << 1
+_HINT_FASTAPI = 1 << 2
+_HINT_REQUIREMENTS_TXT = 1 << 3
+_HINT_PACKAGE_JSON = 1 << 4
+_HINT_REACT = 1 << 5
+_HINT_VUE = 1 << 6
+_HINT_ANGULAR = 1 << 7
+
+_EXT_TO_LANG = {
+    '.py': 'Python',
+    '.js': 'JavaScript/TypeScript',
+    '.ts': 'JavaScript/TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C/C++',
+    '.c': 'C/C++',
+    '.h': 'C/C++',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+}
+
+# Memoized analyze() results keyed by (path, mtime token, scan options);
+# FIFO-evicted once the cap is reached. An on-disk pickle cache lets
+# separate CLI invocations skip the walk too, but it is keyed by a
+# per-file stat digest instead of the mtime token — editing a file's
+# content moves its own mtime, not any directory's, so the cheap token
+# would serve stale analysis across invocations forever.
+_ANALYZE_CACHE: Dict[tuple, 'ProjectInfo'] = {}
+_ANALYZE_CACHE_MAX = 128
+_DISK_CACHE_DIR = Path.home() / '.cache' / 'neogit' / 'analyze'
+
+# Separator-to-space table for humanizing project names in one pass.
+_NAME_TRANS = str.maketrans({'-': ' ', '_': ' ', '.': ' '})
+
+# Leading package name of a requirement line; handles all PEP 440
+# specifiers (==, >=, <=, ~=, !=, <, >) and environment markers.
+_REQ_NAME_RE = re.compile(r'^\s*([A-Za-z0-9_.\-]+)')
+
+_KEYWORD_HINTS = {
+    'requirements.txt': _HINT_REQUIREMENTS_TXT,
+    'package.json': _HINT_PACKAGE_JSON,
+    'django': _HINT_DJANGO,
+    'flask': _HINT_FLASK,
+    'fastapi': _HINT_FASTAPI,
+    'react': _HINT_REACT,
+    'vue': _HINT_VUE,
+    'angular': _HINT_ANGULAR,
+}
+
+_ALL_HINTS = _HINT_DJANGO | _HINT_FLASK | _HINT_FASTAPI \
+    | _HINT_REQUIREMENTS_TXT | _HINT_PACKAGE_JSON \
+    | _HINT_REACT | _HINT_VUE | _HINT_ANGULAR
 
 @dataclass
 class ProjectInfo:
@@ -10,158 +114,485 @@ class ProjectInfo:
     language: str
     framework: Optional[str]
     dependencies: List[str]
-    files: List[str]
     structure: Dict[str, Any]
     has_tests: bool
     has_docs: bool
     has_license: bool
     has_requirements: bool
+    _file_provider: Optional[Callable[[], List[str]]] = field(
+        default=None, repr=False, compare=False)
+    _files: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    @property
+    def files(self) -> List[str]:
+        """Project file list, materialized on first access.
+
+        Consumers that only need the language, flags, or structure never
+        pay for holding every path of a large tree in memory."""
+        if self._files is None:
+            provider = self._file_provider
+            self._files = provider() if provider is not None else []
+        return self._files
+
+def _empty_structure() -> Dict[str, List[str]]:
+    return {'src_dirs': [], 'config_files': [], 'build_files': [], 'test_dirs': []}
+
+@dataclass
+class _ScanResult:
+    files: List[str] = field(default_factory=list)
+    structure: Dict[str, List[str]] = field(default_factory=_empty_structure)
+    # Keyword regex in use; None until the scan commits to the generic or
+    # the specialized Python-only alternation (see _maybe_specialize).
+    keyword_re: Optional[re.Pattern] = None
+    extensions: Counter = field(default_factory=Counter)
+    dep_files: List[str] = field(default_factory=list)
+    framework_hints: int = 0
+    ext_samples: int = 0
+    has_tests: bool = False
+    has_docs: bool = False
+    has_license: bool = False
+    has_requirements_kw: bool = False
+    has_txt: bool = False
+    has_root_package_json: bool = False
+
+    def is_sufficient(self) -> bool:
+        """True once further scanning cannot change the analysis outcome
+        enough to matter: all flags set, a dependency file located, and a
+        large enough extension sample for language detection."""
+        return (self.has_tests and self.has_docs and self.has_license
+                and self.has_requirements_kw
+                and self.ext_samples >= 1000
+                and bool(self.dep_files))
+
+    def merge(self, other: '_ScanResult') -> None:
+        self.files.extend(other.files)
+        for bucket, names in other.structure.items():
+            self.structure[bucket].extend(names)
+        self.extensions.update(other.extensions)
+        self.ext_samples += other.ext_samples
+        self.dep_files.extend(other.dep_files)
+        self.framework_hints |= other.framework_hints
+        self.has_tests = self.has_tests or other.has_tests
+        self.has_docs = self.has_docs or other.has_docs
+        self.has_license = self.has_license or other.has_license
+        self.has_requirements_kw = self.has_requirements_kw or other.has_requirements_kw
+        self.has_txt = self.has_txt or other.has_txt
+        self.has_root_package_json = self.has_root_package_json or other.has_root_package_json
 
 class ProjectAnalyzer:
-    def __init__(self, project_path: Path):
+    # One C-level scan per already-lowercased filename instead of repeated
+    # substring checks; longer alternatives come first so they win over
+    # their prefixes.
+    _KEYWORD_RE = re.compile(
+        r'requirements\.txt|requirements|package\.json|test|spec|readme|docs'
+        r'|license|django|flask|fastapi|react|vue|angular')
+    # Smaller alternation for trees that are overwhelmingly Python: the
+    # JS-framework keywords cannot influence the result once the language
+    # is settled, and a simpler pattern scans faster.
+    _KEYWORD_RE_PYTHON = re.compile(
+        r'requirements\.txt|requirements|test|spec|readme|docs'
+        r'|license|django|flask|fastapi')
+
+    # Sample size after which the scan commits to a keyword regex.
+    _SPECIALIZE_AFTER = 200
+
+    def __init__(self, project_path: Path, workers: Optional[int] = None,
+                 quick: bool = False, exclude_dirs: Optional[set] = None,
+                 deep_cache: bool = False):
         self.project_path = project_path
+        if workers is None:
+            workers = int(os.environ.get('NEOGIT_SCAN_WORKERS', '1'))
+        self.workers = workers
+        self.quick = quick
+        self.exclude_dirs = frozenset(exclude_dirs or ())
+        self.deep_cache = deep_cache
 
     def analyze(self) -> ProjectInfo:
-        files = self._get_project_files()
-        language = self._detect_language(files)
-        framework = self._detect_framework(files, language)
-        dependencies = self._extract_dependencies(files, language)
-        return ProjectInfo(
+        try:
+            key = (str(self.project_path.resolve()), self._cache_token(),
+                   self.quick, self.exclude_dirs)
+        except OSError:
+            key = None
+        disk_key = None
+        if key is not None:
+            cached = _ANALYZE_CACHE.get(key)
+            if cached is not None:
+                return cached
+            try:
+                disk_key = (key[0], self._stat_hash(), self.quick, self.exclude_dirs)
+            except OSError:
+                disk_key = None
+            else:
+                cached = self._disk_cache_get(disk_key)
+            if cached is not None:
+                self._cache_store(key, cached)
+                return cached
+        # Collect paths on this same traversal: the result feeds prompt
+        # generation, whose "Key Files" line touches .files, and a lazy
+        # provider there would mean a second full walk. Quick mode may
+        # stop early, so its partial list stays lazy instead; likewise
+        # disk-cache-restored results keep the provider (see
+        # _disk_cache_get).
+        scan = self._scan(collect_files=not self.quick)
+        language = self._detect_language(scan.extensions)
+        framework = self._detect_framework(scan, language)
+        dependencies = self._extract_dependencies(scan, language)
+        info = ProjectInfo(
             name=self.project_path.name,
             description=self._generate_description(),
             language=language,
             framework=framework,
             dependencies=dependencies,
-            files=files,
-            structure=self._analyze_structure(),
-            has_tests=self._has_tests(files),
-            has_docs=self._has_docs(files),
-            has_license=self._has_license(files),
-            has_requirements=self._has_requirements(files, language)
+            _file_provider=self._get_project_files,
+            structure=scan.structure,
+            has_tests=scan.has_tests,
+            has_docs=scan.has_docs,
+            has_license=scan.has_license,
+            has_requirements=self._has_requirements(scan, language)
         )
+        if not self.quick:
+            info._files = scan.files
+        if key is not None:
+            self._cache_store(key, info)
+        if disk_key is not None:
+            self._disk_cache_put(disk_key, info)
+        return info
+
+    @staticmethod
+    def _cache_store(key: tuple, info: 'ProjectInfo') -> None:
+        if len(_ANALYZE_CACHE) >= _ANALYZE_CACHE_MAX:
+            _ANALYZE_CACHE.pop(next(iter(_ANALYZE_CACHE)))
+        _ANALYZE_CACHE[key] = info
+
+    @staticmethod
+    def _disk_cache_path(key: tuple) -> Path:
+        return _DISK_CACHE_DIR / f"{hashlib.sha1(repr(key).encode()).hexdigest()}.pkl"
+
+    def _disk_cache_get(self, key: tuple) -> Optional['ProjectInfo']:
+        try:
+            with open(self._disk_cache_path(key), 'rb') as f:
+                info = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError):
+            return None
+        # The provider is a bound method and is stripped before pickling;
+        # reattach so the files property still materializes lazily.
+        info._file_provider = self._get_project_files
+        return info
+
+    def _disk_cache_put(self, key: tuple, info: 'ProjectInfo') -> None:
+        clone = copy.copy(info)
+        clone._file_provider = None
+        try:
+            _DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(self._disk_cache_path(key), 'wb') as f:
+                pickle.dump(clone, f, pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
+    def _stat_hash(self) -> str:
+        """Digest of sorted (path, mtime, size) over every source file.
+
+        A stat-only walk — no reads, no keyword matching — but unlike
+        _cache_token it sees content edits: rewriting a file moves that
+        file's mtime while every directory mtime stays put. This is the
+        only key safe to persist across invocations."""
+        stats = []
+        exclude_dirs = self.exclude_dirs
+        stack = [(str(self.project_path), '')]
+        while stack:
+            abs_path, rel_prefix = stack.pop()
+            try:
+                entries = os.scandir(abs_path)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in _DIR_BLACKLIST and name not in exclude_dirs:
+                            stack.append((entry.path, rel_prefix + name + os.sep))
+                    elif entry.is_file(follow_symlinks=False):
+                        if _should_skip(name):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        stats.append((rel_prefix + name, st.st_mtime_ns, st.st_size))
+        stats.sort()
+        return hashlib.sha1(repr(stats).encode()).hexdigest()
+
+    def _cache_token(self) -> int:
+        """Cheap change token for the in-process cache: the root mtime,
+        or with deep_cache a mix of every (pruned) directory mtime."""
+        if not self.deep_cache:
+            return os.stat(self.project_path).st_mtime_ns
+        token = 0
+        stack = [str(self.project_path)]
+        while stack:
+            abs_path = stack.pop()
+            try:
+                entries = os.scandir(abs_path)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if (name.startswith('.') or name in _DIR_BLACKLIST
+                            or name in self.exclude_dirs):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        token ^= hash((entry.path, entry.stat(follow_symlinks=False).st_mtime_ns))
+                        stack.append(entry.path)
+        return token
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        _ANALYZE_CACHE.clear()
 
     def _get_project_files(self) -> List[str]:
-        files = []
-        for root, dirs, filenames in os.walk(self.project_path):
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__', 'venv', '.git']]
-            for filename in filenames:
-                if not filename.startswith('.') and not filename.endswith(('.pyc', '.log', '.tmp')):
-                    rel_path = os.path.relpath(os.path.join(root, filename), self.project_path)
-                    files.append(rel_path)
-        return files
-
-    def _detect_language(self, files: List[str]) -> str:
-        extensions = {}
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext:
-                extensions[ext] = extensions.get(ext, 0) + 1
-        if '.py' in extensions:
-            return 'Python'
-        elif '.js' in extensions or '.ts' in extensions:
-            return 'JavaScript/TypeScript'
-        elif '.java' in extensions:
-            return 'Java'
-        elif '.cpp' in extensions or '.c' in extensions:
-            return 'C/C++'
-        elif '.go' in extensions:
-            return 'Go'
-        elif '.rs' in extensions:
-            return 'Rust'
-        elif '.rb' in extensions:
-            return 'Ruby'
-        elif '.php' in extensions:
-            return 'PHP'
+        return self._scan().files
+
+    def _scan(self, collect_files: bool = True) -> _ScanResult:
+        """Single traversal that gathers files, extension counts, boolean
+        flags, framework hints, and dependency-file candidates."""
+        if self.workers > 1:
+            return self._parallel_scan(self.workers, collect_files)
+        scan = _ScanResult()
+        # Stack of (absolute dir, relative prefix ending in os.sep or empty);
+        # child paths are built by concatenation so no join/relpath per entry.
+        stack = [(str(self.project_path), '')]
+        while stack:
+            abs_path, rel_prefix = stack.pop()
+            stack.extend(self._scan_dir(abs_path, rel_prefix, scan, collect_files))
+            if scan.keyword_re is None:
+                self._maybe_specialize(scan)
+            if self.quick and scan.is_sufficient():
+                break
+        return scan
+
+    @classmethod
+    def _maybe_specialize(cls, scan: _ScanResult) -> None:
+        """Commit to the Python-only keyword regex once enough extension
+        samples show the tree is >80% Python; otherwise lock in the
+        generic one so the ratio is not re-checked per directory."""
+        if scan.ext_samples < cls._SPECIALIZE_AFTER:
+            return
+        if scan.extensions.get('.py', 0) * 5 >= scan.ext_samples * 4:
+            scan.keyword_re = cls._KEYWORD_RE_PYTHON
         else:
+            scan.keyword_re = cls._KEYWORD_RE
+
+    def _parallel_scan(self, workers: int, collect_files: bool = True) -> _ScanResult:
+        """Traverse with one task per directory on a thread pool.
+
+        os.scandir releases the GIL during the underlying syscalls, so on
+        high-latency filesystems concurrent workers hide the per-directory
+        round-trips. Workers merge per-directory partial results under a
+        lock to keep accumulation race-free."""
+        scan = _ScanResult()
+        merge_lock = threading.Lock()
+        dirs: queue.Queue = queue.Queue()
+        dirs.put((str(self.project_path), ''))
+        stop = object()
+        done = threading.Event()
+
+        def drain():
+            while True:
+                item = dirs.get()
+                if item is stop:
+                    dirs.task_done()
+                    return
+                if done.is_set():
+                    dirs.task_done()
+                    continue
+                abs_path, rel_prefix = item
+                try:
+                    local = _ScanResult()
+                    for child in self._scan_dir(abs_path, rel_prefix, local, collect_files):
+                        dirs.put(child)
+                    with merge_lock:
+                        scan.merge(local)
+                        if self.quick and scan.is_sufficient():
+                            done.set()
+                finally:
+                    dirs.task_done()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(drain) for _ in range(workers)]
+            dirs.join()
+            for _ in range(workers):
+                dirs.put(stop)
+            for future in futures:
+                future.result()
+        return scan
+
+    def _scan_dir(self, abs_path: str, rel_prefix: str, scan: _ScanResult,
+                  collect_files: bool = True) -> List[tuple]:
+        """Scan one directory into `scan`, returning child dirs to visit."""
+        exclude_dirs = self.exclude_dirs
+        children = []
+        try:
+            entries = os.scandir(abs_path)
+        except OSError:
+            return children
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    # Root-level structure is classified here so no extra
+                    # iterdir pass over the root is needed.
+                    if not rel_prefix:
+                        if name in self._SRC_DIR_NAMES:
+                            scan.structure['src_dirs'].append(name)
+                        elif 'test' in name.lower():
+                            scan.structure['test_dirs'].append(name)
+                    if name not in _DIR_BLACKLIST and name not in exclude_dirs:
+                        self._note_keywords(scan, name.lower())
+                        children.append((abs_path + os.sep + name, rel_prefix + name + os.sep))
+                elif entry.is_file(follow_symlinks=False):
+                    if _should_skip(name):
+                        continue
+                    rel_path = rel_prefix + name
+                    if collect_files:
+                        scan.files.append(rel_path)
+                    # Lowercase once per entry; every check below reuses it.
+                    name_lower = name.lower()
+                    saw_requirements = self._note_keywords(scan, name_lower)
+                    ext = _ext_of(name_lower)
+                    if not rel_prefix:
+                        if ext in self._CFG_EXTS:
+                            scan.structure['config_files'].append(name)
+                        elif ext in self._BUILD_EXTS or 'build' in name_lower:
+                            scan.structure['build_files'].append(name)
+                    if ext:
+                        scan.extensions[ext] += 1
+                        scan.ext_samples += 1
+                    if ext == '.txt':
+                        scan.has_txt = True
+                    if saw_requirements or ext == '.txt':
+                        scan.dep_files.append(rel_path)
+                    if name == 'package.json' and not rel_prefix:
+                        scan.has_root_package_json = True
+        return children
+
+    @classmethod
+    def _note_keywords(cls, scan: _ScanResult, name_lower: str) -> bool:
+        """Record every keyword occurrence in one regex pass over the
+        pre-lowercased name.
+
+        Returns True if a requirements file keyword was seen, so the caller
+        can collect the path as a dependency-file candidate."""
+        # Once every flag and hint bit is set the regex can teach us
+        # nothing new; keep only the cheap requirements presence test
+        # needed for dependency-file collection.
+        if (scan.framework_hints == _ALL_HINTS and scan.has_tests
+                and scan.has_docs and scan.has_license):
+            return 'requirements' in name_lower
+        saw_requirements = False
+        keyword_re = scan.keyword_re or cls._KEYWORD_RE
+        for m in keyword_re.finditer(name_lower):
+            kw = m.group(0)
+            hint = _KEYWORD_HINTS.get(kw)
+            if hint is not None:
+                scan.framework_hints |= hint
+            if kw == 'test' or kw == 'spec':
+                scan.has_tests = True
+            elif kw == 'readme' or kw == 'docs':
+                scan.has_docs = True
+            elif kw == 'license':
+                scan.has_license = True
+            elif kw == 'requirements' or kw == 'requirements.txt':
+                scan.has_requirements_kw = True
+                saw_requirements = True
+        return saw_requirements
+
+    def _detect_language(self, extensions: Counter) -> str:
+        # Aggregate counts per language (so .js and .ts pool together) and
+        # let Counter pick the true majority in one C-level call.
+        lang_counts: Counter = Counter()
+        for ext, count in extensions.items():
+            language = _EXT_TO_LANG.get(ext)
+            if language:
+                lang_counts[language] += count
+        if not lang_counts:
             return 'Unknown'
+        return lang_counts.most_common(1)[0][0]
 
-    def _detect_framework(self, files: List[str], language: str) -> Optional[str]:
+    def _detect_framework(self, scan: _ScanResult, language: str) -> Optional[str]:
+        hints = scan.framework_hints
         if language == 'Python':
-            if any('django' in f.lower() for f in files):
+            if hints & _HINT_DJANGO:
                 return 'Django'
-            elif any('flask' in f.lower() for f in files):
+            elif hints & _HINT_FLASK:
                 return 'Flask'
-            elif any('fastapi' in f.lower() for f in files):
+            elif hints & _HINT_FASTAPI:
                 return 'FastAPI'
-            elif any('requirements.txt' in f for f in files):
+            elif hints & _HINT_REQUIREMENTS_TXT:
                 return 'Python'
         elif language == 'JavaScript/TypeScript':
-            if any('package.json' in f for f in files):
+            if hints & _HINT_PACKAGE_JSON:
                 return 'Node.js'
-            elif any('react' in f.lower() for f in files):
+            elif hints & _HINT_REACT:
                 return 'React'
-            elif any('vue' in f.lower() for f in files):
+            elif hints & _HINT_VUE:
                 return 'Vue.js'
-            elif any('angular' in f.lower() for f in files):
+            elif hints & _HINT_ANGULAR:
                 return 'Angular'
         return None
 
-    def _extract_dependencies(self, files: List[str], language: str) -> List[str]:
-        dependencies = []
+    _MAX_DEPENDENCIES = 10
+
+    def _extract_dependencies(self, scan: _ScanResult, language: str) -> List[str]:
+        # Insertion-ordered dedup, stopping as soon as the cap is reached
+        # so large requirement files are not read to the end.
+        seen: Dict[str, None] = {}
+        limit = self._MAX_DEPENDENCIES
         if language == 'Python':
-            req_files = [f for f in files if 'requirements' in f.lower() or f.endswith('.txt')]
-            for req_file in req_files:
+            for req_file in scan.dep_files:
+                # These files are tiny; one read_bytes plus splitlines beats
+                # per-line text-mode iteration and newline translation.
                 try:
-                    with open(self.project_path / req_file, 'r') as f:
-                        for line in f:
-                            line = line.strip()
-                            if line and not line.startswith('#'):
-                                dependencies.append(line.split('==')[0].split('>=')[0].split('<=')[0])
-                except:
-                    pass
+                    raw = (self.project_path / req_file).read_bytes()
+                except OSError:
+                    continue
+                for line in raw.decode('utf-8', 'replace').splitlines():
+                    m = _REQ_NAME_RE.match(line)
+                    if m and m.group(1) not in seen:
+                        seen[m.group(1)] = None
+                        if len(seen) >= limit:
+                            return list(seen)
         elif language == 'JavaScript/TypeScript':
-            if 'package.json' in files:
+            if scan.has_root_package_json:
                 import json
                 try:
-                    with open(self.project_path / 'package.json', 'r') as f:
-                        data = json.load(f)
-                        if 'dependencies' in data:
-                            dependencies.extend(data['dependencies'].keys())
-                        if 'devDependencies' in data:
-                            dependencies.extend(data['devDependencies'].keys())
+                    data = json.loads((self.project_path / 'package.json').read_bytes())
+                    for section in ('dependencies', 'devDependencies'):
+                        for name in data.get(section, ()):
+                            if name not in seen:
+                                seen[name] = None
+                                if len(seen) >= limit:
+                                    return list(seen)
                 except:
                     pass
-        return list(set(dependencies))[:10]
+        return list(seen)
 
     def _generate_description(self) -> str:
-        name = self.project_path.name
-        description = name.replace('-', ' ').replace('_', ' ').title()
-        return f"A {description.lower()} project"
-
-    def _analyze_structure(self) -> Dict[str, Any]:
-        structure = {
-            'src_dirs': [],
-            'config_files': [],
-            'build_files': [],
-            'test_dirs': []
-        }
-        for item in self.project_path.iterdir():
-            if item.is_dir():
-                if item.name in ['src', 'app', 'lib', 'source']:
-                    structure['src_dirs'].append(item.name)
-                elif 'test' in item.name.lower():
-                    structure['test_dirs'].append(item.name)
-            elif item.is_file():
-                if any(ext in item.name.lower() for ext in ['.json', '.yaml', '.yml', '.toml', '.ini']):
-                    structure['config_files'].append(item.name)
-                elif any(ext in item.name.lower() for ext in ['.lock', '.spec', 'build']):
-                    structure['build_files'].append(item.name)
-        return structure
-
-    def _has_tests(self, files: List[str]) -> bool:
-        return any('test' in f.lower() or 'spec' in f.lower() for f in files)
-
-    def _has_docs(self, files: List[str]) -> bool:
-        return any('readme' in f.lower() or 'docs' in f.lower() for f in files)
-
-    def _has_license(self, files: List[str]) -> bool:
-        return any('license' in f.lower() for f in files)
-
-    def _has_requirements(self, files: List[str], language: str) -> bool:
+        return f"A {self.project_path.name.translate(_NAME_TRANS).lower()} project"
+
+    # Root-entry classification sets; file classification uses the actual
+    # extension so e.g. config.json.bak is not mistaken for a config file.
+    _SRC_DIR_NAMES = frozenset({'src', 'app', 'lib', 'source'})
+    _CFG_EXTS = frozenset({'.json', '.yaml', '.yml', '.toml', '.ini'})
+    _BUILD_EXTS = frozenset({'.lock', '.spec'})
+
+    def _has_requirements(self, scan: _ScanResult, language: str) -> bool:
         if language == 'Python':
-            return any('requirements' in f.lower() or f.endswith('.txt') for f in files)
+            return scan.has_requirements_kw or scan.has_txt
         elif language == 'JavaScript/TypeScript':
-            return 'package.json' in files
+            return scan.has_root_package_json
         return False
 
-# ... ProjectAnalyzer class and related logic from readme_generator.py ... 
\ No newline at end of file
+# ... ProjectAnalyzer class and related logic from readme_generator.py ...
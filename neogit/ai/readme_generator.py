@@ -1,14 +1,158 @@
+import asyncio
+import functools
+import hashlib
+import io
 import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import quote
 from rich.console import Console
 from rich.panel import Panel
-import openai
-import anthropic
-import google.generativeai as genai
-import requests
+import httpx
+import jinja2
+import orjson
 from neogit.ai.project_analyzer import ProjectInfo
 
 console = Console()
 
+# One pooled HTTP/2 client shared by every READMEGenerator so back-to-back
+# generations reuse (and multiplex over) established connections instead of
+# paying a fresh TCP+TLS handshake per request.
+_HTTPX = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    timeout=60,
+)
+
+# Transient statuses are retried with exponential backoff instead of
+# failing straight over to the template; mirrors urllib3's
+# Retry(total=3, backoff_factor=0.5, status_forcelist=...) semantics on
+# the httpx stack, honouring Retry-After when the server sends one.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.5
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return _RETRY_BACKOFF * (2 ** attempt)
+
+# On-disk exact-match cache of AI-generated READMEs, keyed by a SHA-256 of the
+# canonical prompt. A hit skips the LLM round-trip entirely.
+_CACHE_DB = Path.home() / ".cache" / "neogit" / "readme_cache.db"
+
+# Per-language command table: one lookup resolves every command kind, and
+# language coverage is visible (and checkable) in a single structure.
+LANG_COMMANDS: Dict[str, Dict[str, str]] = {
+    'Python': {
+        'install': "pip install -r requirements.txt",
+        'run': "python main.py",
+        'test': "python -m pytest",
+        'dev_install': "pip install -r requirements-dev.txt",
+    },
+    'JavaScript/TypeScript': {
+        'install': "npm install",
+        'run': "npm start",
+        'test': "npm test",
+        'dev_install': "npm install --include=dev",
+    },
+}
+
+_DEFAULT_COMMANDS = {
+    'install': "# Install dependencies based on your project type",
+    'run': "# Run the application based on your project type",
+    'test': "# Run tests based on your project type",
+    'dev_install': "# Install dependencies based on your project type",
+}
+
+_LANG_ICONS = {
+    'Python': '\U0001F40D',
+    'JavaScript/TypeScript': '\u26A1\uFE0F',
+    'Java': '\u2615',
+    'C/C++': '\U0001F4BB',
+    'Go': '\U0001F9A6',
+    'Rust': '\U0001F980',
+    'Ruby': '\U0001F48E',
+    'PHP': '\U0001F418',
+    'Unknown': '\u2753'
+}
+
+def _cap_join(items, limit: int = 10) -> str:
+    """Comma-join at most `limit` items, without list-repr brackets/quotes."""
+    return ", ".join(str(item) for item in items[:limit])
+
+@functools.lru_cache(maxsize=32)
+def _lang_badge(language: str) -> str:
+    return (
+        "![License](https://img.shields.io/badge/license-MIT-green.svg)\n"
+        f"![Language](https://img.shields.io/badge/language-{quote(language)}-blue.svg)"
+    )
+
+# Templates are compiled to Python bytecode once at import; rendering is
+# then a straight sequence of string writes instead of f-string assembly.
+_ENV = jinja2.Environment(
+    loader=jinja2.PackageLoader("neogit.ai", "templates"),
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+)
+_SIMPLE_TPL = _ENV.get_template("simple.md.j2")
+_INSTALLATION_TPL = _ENV.get_template("installation.md.j2")
+_ADVANCED_TPL = _ENV.get_template("advanced.md.j2")
+
+# Async counterpart of _HTTP, created on first use so importing this module
+# never requires a running event loop. Unlike the sync client it must not
+# outlive an asyncio.run(): its pooled connections stay bound to the loop
+# they were opened on, so each gather closes it on the way out (see
+# _close_async_http) and the next run starts a fresh one.
+_AHTTP: Optional[httpx.AsyncClient] = None
+
+def _async_http() -> httpx.AsyncClient:
+    global _AHTTP
+    if _AHTTP is None or _AHTTP.is_closed:
+        _AHTTP = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            timeout=60,
+        )
+    return _AHTTP
+
+async def _close_async_http() -> None:
+    global _AHTTP
+    if _AHTTP is not None:
+        client, _AHTTP = _AHTTP, None
+        await client.aclose()
+
+@dataclass
+class RenderCtx:
+    """Derived ProjectInfo fields computed once per template render."""
+    name: str
+    deps_head: str
+    install: str
+    run: str
+    test: str
+    dev_install: str
+    verify: str
+    config_section: str
+
+@dataclass
+class ProviderAdapter:
+    """Uniform provider surface: one completion call plus a diagnostic
+    pre-check. Cross-cutting concerns (caching, fallback, diagnostics)
+    live once in the dispatcher instead of in five provider methods."""
+    complete: Callable[[str, str], str]
+    precheck: Callable[[], bool]
+    credential: str
+
 class READMEGenerator:
     SYSTEM_PROMPT = (
         "You are an expert technical writer and open source documentation specialist. "
@@ -21,229 +165,602 @@ class READMEGenerator:
         "Be concise but thorough, and make the README welcoming for both new users and contributors."
     )
 
-    def __init__(self, ai_providers=None, selected_provider: str = "openai"):
+    # Diagnostic pre-check outcomes keyed by (provider, credential); a
+    # key/endpoint is stable for a process's lifetime, so repeated failures
+    # within the TTL window do not re-probe the provider.
+    _PRECHECK_CACHE: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+    _PRECHECK_TTL = 600.0
+
+    def __init__(self, ai_providers=None, selected_provider: str = "openai",
+                 on_token: Optional[Callable[[str], None]] = None,
+                 warm_prechecks: bool = False):
         self.ai_providers = ai_providers or {}
         self.selected_provider = selected_provider
+        # Invoked with each streamed token so callers can render output as
+        # it arrives instead of waiting for the full completion.
+        self.on_token = on_token
         self.openai_client = None
         self.anthropic_client = None
         self.google_client = None
         self.hf_client = None
         self.ollama_client = None
-        # Setup clients based on config
-        prov = self.selected_provider
+        self.openai_async = None
+        self.anthropic_async = None
+        if warm_prechecks:
+            # Bring up every configured provider and probe them all in
+            # parallel so a later provider switch or fallback never blocks
+            # on a serial pre-check round-trip.
+            for prov in self.ai_providers:
+                self._setup_client(prov)
+            self._warm_prechecks()
+        else:
+            self._setup_client(self.selected_provider)
+
+    def _setup_client(self, prov: str) -> None:
+        # Provider SDKs are imported lazily: google.generativeai alone can
+        # add hundreds of ms of import time, so only the selected
+        # provider's stack is loaded.
         if prov == "openai" and self.ai_providers.get("openai"):
-            self.openai_client = openai.OpenAI(api_key=self.ai_providers["openai"].get("api_key"))
+            import openai
+            api_key = self.ai_providers["openai"].get("api_key")
+            self.openai_client = openai.OpenAI(api_key=api_key)
         elif prov == "anthropic" and self.ai_providers.get("anthropic"):
-            self.anthropic_client = anthropic.Anthropic(api_key=self.ai_providers["anthropic"].get("api_key"))
+            import anthropic
+            api_key = self.ai_providers["anthropic"].get("api_key")
+            self.anthropic_client = anthropic.Anthropic(api_key=api_key)
         elif prov == "google" and self.ai_providers.get("google"):
+            import google.generativeai as genai
             genai.configure(api_key=self.ai_providers["google"].get("api_key"))
             self.google_client = genai.GenerativeModel('gemini-pro')
         elif prov == "huggingface" and self.ai_providers.get("huggingface"):
-            self.hf_client = requests.Session()
+            self.hf_client = _HTTPX
             self.hf_api_key = self.ai_providers["huggingface"].api_key
             self.hf_model = self.ai_providers["huggingface"].default_model
+            # Auth rides on each request, never on the shared client:
+            # _HTTPX also serves Ollama, and a session-level Authorization
+            # header would leak the HF token to the Ollama endpoint (and a
+            # second generator would clobber it for existing instances).
+            self._hf_headers = {
+                "Authorization": f"Bearer {self.hf_api_key}",
+                "Content-Type": "application/json"
+            }
         elif prov == "ollama" and self.ai_providers.get("ollama"):
-            self.ollama_client = requests.Session()
+            self.ollama_client = _HTTPX
             self.ollama_endpoint = self.ai_providers["ollama"].get("endpoint")
 
-    def generate_readme(self, project_info: ProjectInfo, readme_type: str = "advanced") -> str:
+    def _warm_prechecks(self) -> None:
+        checks = []
+        if self.openai_client:
+            key = (self.ai_providers.get("openai") or {}).get("api_key", "")
+            checks.append(("openai", key, self._precheck_openai))
+        if self.anthropic_client:
+            key = (self.ai_providers.get("anthropic") or {}).get("api_key", "")
+            checks.append(("anthropic", key, self._precheck_anthropic))
+        if self.google_client:
+            key = (self.ai_providers.get("google") or {}).get("api_key", "")
+            checks.append(("google", key, self._precheck_google))
+        if self.hf_client:
+            checks.append(("huggingface", f"{self.hf_api_key}:{self.hf_model}",
+                           self._precheck_huggingface))
+        if self.ollama_client:
+            checks.append(("ollama", self.ollama_endpoint, self._precheck_ollama))
+        if not checks:
+            return
+        with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+            for prov, cred, check in checks:
+                ex.submit(self._precheck, prov, cred, check)
+
+    def generate_readme(self, project_info: ProjectInfo, readme_type: str = "advanced", use_cache: bool = True) -> str:
+        adapter = self._adapter()
+        if adapter is None:
+            return self._generate_template_readme(project_info, readme_type)
+        prompt = self._create_ai_prompt(project_info, readme_type)
+        cache_key = None
+        if use_cache:
+            cache_key = hashlib.sha256(f"{self.selected_provider}\n{prompt}".encode()).hexdigest()
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+        try:
+            readme = adapter.complete(self.SYSTEM_PROMPT, prompt)
+        except Exception as e:
+            console.print(f"[red]Error generating {self.selected_provider} README: {e}[/red]")
+            # Probe key/model access only now that the call has failed; the
+            # happy path makes exactly one HTTP request.
+            self._precheck(self.selected_provider, adapter.credential, adapter.precheck)
+            console.print("[yellow]Falling back to template-based generation.[/yellow]")
+            return self._generate_template_readme(project_info, readme_type)
+        if cache_key is not None and readme:
+            self._cache_put(cache_key, readme)
+        return readme
+
+    def _adapter(self) -> Optional[ProviderAdapter]:
         prov = self.selected_provider
         if prov == "openai" and self.openai_client:
-            return self._generate_openai_readme(project_info, readme_type)
+            return ProviderAdapter(
+                complete=self._complete_openai,
+                precheck=self._precheck_openai,
+                credential=(self.ai_providers.get("openai") or {}).get("api_key", ""),
+            )
         elif prov == "anthropic" and self.anthropic_client:
-            return self._generate_anthropic_readme(project_info, readme_type)
+            return ProviderAdapter(
+                complete=self._complete_anthropic,
+                precheck=self._precheck_anthropic,
+                credential=(self.ai_providers.get("anthropic") or {}).get("api_key", ""),
+            )
         elif prov == "google" and self.google_client:
-            return self._generate_google_readme(project_info, readme_type)
+            return ProviderAdapter(
+                complete=self._complete_google,
+                precheck=self._precheck_google,
+                credential=(self.ai_providers.get("google") or {}).get("api_key", ""),
+            )
         elif prov == "huggingface" and self.hf_client:
-            return self._generate_huggingface_readme(project_info, readme_type)
+            return ProviderAdapter(
+                complete=self._complete_huggingface,
+                precheck=self._precheck_huggingface,
+                credential=f"{self.hf_api_key}:{self.hf_model}",
+            )
         elif prov == "ollama" and self.ollama_client:
-            return self._generate_ollama_readme(project_info, readme_type)
-        else:
-            return self._generate_template_readme(project_info, readme_type)
-
-    def _generate_openai_readme(self, project_info: ProjectInfo, readme_type: str) -> str:
+            return ProviderAdapter(
+                complete=self._complete_ollama,
+                precheck=self._precheck_ollama,
+                credential=self.ollama_endpoint,
+            )
+        return None
+
+    async def generate_readmes(self, projects, readme_type: str = "advanced"):
+        """Generate READMEs for several projects concurrently.
+
+        Each provider call spends seconds waiting on the network, so firing
+        them together with asyncio.gather makes N generations cost roughly
+        one. For a local Ollama server, raise OLLAMA_NUM_PARALLEL so the
+        server accepts matching concurrency. Exceptions are returned in
+        place of results rather than raised.
+        """
+        tasks = [self._agenerate(p, readme_type) for p in projects]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # Connections pooled during this gather belong to the current
+            # loop; anything left open here fails the next asyncio.run()
+            # with "Event loop is closed".
+            await self._close_async_clients()
+
+    async def _close_async_clients(self) -> None:
+        """Tear down every loop-bound client; all are rebuilt lazily on
+        whatever loop the next gather runs under."""
+        await _close_async_http()
+        if self.openai_async is not None:
+            client, self.openai_async = self.openai_async, None
+            await client.close()
+        if self.anthropic_async is not None:
+            client, self.anthropic_async = self.anthropic_async, None
+            await client.close()
+
+    def _async_openai(self):
+        # Created inside the running loop (not in __init__) so its pooled
+        # connections never outlive an asyncio.run() boundary.
+        if self.openai_async is None:
+            import openai
+            self.openai_async = openai.AsyncOpenAI(
+                api_key=(self.ai_providers.get("openai") or {}).get("api_key"))
+        return self.openai_async
+
+    def _async_anthropic(self):
+        if self.anthropic_async is None:
+            import anthropic
+            self.anthropic_async = anthropic.AsyncAnthropic(
+                api_key=(self.ai_providers.get("anthropic") or {}).get("api_key"))
+        return self.anthropic_async
+
+    async def _agenerate(self, project_info: ProjectInfo, readme_type: str) -> str:
+        prov = self.selected_provider
         try:
-            # Pre-check: verify OpenAI API key and model
-            try:
-                models = self.openai_client.models.list()
-                model_names = [m.id for m in models.data]
-                if "gpt-3.5-turbo" not in model_names:
-                    console.print(f"[red]OpenAI model 'gpt-3.5-turbo' is not accessible with your API key.[/red]")
-                    console.print("[yellow]You can test your key with this command:")
-                    console.print("[bold]curl https://api.openai.com/v1/models -H 'Authorization: Bearer <your_openai_api_key>'[/bold]")
-                    return self._generate_template_readme(project_info, readme_type)
-            except Exception as e:
-                console.print(f"[red]OpenAI API key/model check failed: {e}[/red]")
-                console.print("[yellow]You can test your key with this command:")
-                console.print("[bold]curl https://api.openai.com/v1/models -H 'Authorization: Bearer <your_openai_api_key>'[/bold]")
-                return self._generate_template_readme(project_info, readme_type)
             prompt = self._create_ai_prompt(project_info, readme_type)
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.7
-            )
-            return response.choices[0].message.content
+            if prov == "openai" and self.openai_client:
+                response = await self._async_openai().chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=[
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=2000,
+                    temperature=0.7
+                )
+                return response.choices[0].message.content
+            elif prov == "anthropic" and self.anthropic_client:
+                response = await self._async_anthropic().messages.create(
+                    model="claude-3-haiku-20240307",
+                    max_tokens=2000,
+                    temperature=0.7,
+                    system=[{"type": "text", "text": self.SYSTEM_PROMPT,
+                             "cache_control": {"type": "ephemeral"}}],
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                )
+                return response.content[0].text
+            elif prov == "google" and self.google_client:
+                # The google SDK has no async surface here; a thread keeps
+                # the event loop free for the other generations.
+                full_prompt = f"{self.SYSTEM_PROMPT}\n\n{prompt}"
+                response = await asyncio.to_thread(self.google_client.generate_content, full_prompt)
+                return response.text
+            elif prov == "huggingface" and self.hf_client:
+                api_url = f"https://api-inference.huggingface.co/models/{self.hf_model}"
+                payload = {
+                    "inputs": f"{self.SYSTEM_PROMPT}\n\n{prompt}",
+                    "parameters": {
+                        "max_new_tokens": 2000,
+                        "temperature": 0.7,
+                        "do_sample": True,
+                        "top_p": 0.95
+                    }
+                }
+                response = await _async_http().post(
+                    api_url,
+                    headers={"Authorization": f"Bearer {self.hf_api_key}",
+                             "Content-Type": "application/json"},
+                    content=orjson.dumps(payload)
+                )
+                if response.status_code == 200:
+                    result = orjson.loads(response.content)
+                    if isinstance(result, list) and len(result) > 0:
+                        return result[0].get('generated_text', '')
+                    elif isinstance(result, dict):
+                        return result.get('generated_text', '')
+                    return str(result)
+                console.print(f"[red]Hugging Face API error: {response.status_code}[/red]")
+                return self._generate_template_readme(project_info, readme_type)
+            elif prov == "ollama" and self.ollama_client:
+                payload = {
+                    "model": "codellama:7b-instruct",
+                    "prompt": f"{self.SYSTEM_PROMPT}\n\n{prompt}",
+                    "stream": False,
+                    "options": {
+                        "temperature": 0.7,
+                        "top_p": 0.95,
+                        "num_predict": 2000
+                    }
+                }
+                response = await _async_http().post(
+                    f"{self.ollama_endpoint}/api/generate",
+                    content=orjson.dumps(payload),
+                    headers={"Content-Type": "application/json"}
+                )
+                if response.status_code == 200:
+                    return orjson.loads(response.content).get('response', '')
+                console.print(f"[red]Ollama API error: {response.status_code}[/red]")
+                return self._generate_template_readme(project_info, readme_type)
+            else:
+                return self._generate_template_readme(project_info, readme_type)
         except Exception as e:
-            console.print(f"[red]Error generating OpenAI README: {e}[/red]")
+            console.print(f"[red]Error generating README for {project_info.name}: {e}[/red]")
             console.print("[yellow]Falling back to template-based generation.[/yellow]")
             return self._generate_template_readme(project_info, readme_type)
 
-    def _generate_anthropic_readme(self, project_info: ProjectInfo, readme_type: str) -> str:
+    def generate_readmes_batch(self, projects, readme_type: str = "advanced", poll_interval: float = 10.0):
+        """Generate READMEs for many projects through a provider batch job.
+
+        Anthropic and OpenAI price batch requests at half the synchronous
+        rate and schedule them on their bulk tier, so for offline runs one
+        submitted job replaces N interactive round-trips. Blocks until the
+        job finishes; providers without a batch API fall back to templates.
+        """
+        prov = self.selected_provider
+        prompts = [self._create_ai_prompt(p, readme_type) for p in projects]
         try:
-            # Pre-check: verify Anthropic API key and model
-            try:
-                models = self.anthropic_client.models.list()
-                model_names = [m["id"] for m in models["data"]]
-                if "claude-3-haiku-20240307" not in model_names:
-                    console.print(f"[red]Anthropic model 'claude-3-haiku-20240307' is not accessible with your API key.[/red]")
-                    console.print("[yellow]You can test your key with this command:")
-                    console.print("[bold]curl https://api.anthropic.com/v1/models -H 'x-api-key: <your_anthropic_api_key>'[/bold]")
-                    return self._generate_template_readme(project_info, readme_type)
-            except Exception as e:
-                console.print(f"[red]Anthropic API key/model check failed: {e}[/red]")
-                console.print("[yellow]You can test your key with this command:")
-                console.print("[bold]curl https://api.anthropic.com/v1/models -H 'x-api-key: <your_anthropic_api_key>'[/bold]")
-                return self._generate_template_readme(project_info, readme_type)
-            prompt = self._create_ai_prompt(project_info, readme_type)
-            response = self.anthropic_client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=2000,
-                temperature=0.7,
-                messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            return response.content[0].text
+            if prov == "anthropic" and self.anthropic_client:
+                results = self._generate_anthropic_batch(prompts, poll_interval)
+            elif prov == "openai" and self.openai_client:
+                results = self._generate_openai_batch(prompts, poll_interval)
+            else:
+                console.print(f"[yellow]Provider '{prov}' has no batch API; using templates.[/yellow]")
+                return [self._generate_template_readme(p, readme_type) for p in projects]
         except Exception as e:
-            console.print(f"[red]Error generating Anthropic README: {e}[/red]")
+            console.print(f"[red]Batch generation failed: {e}[/red]")
             console.print("[yellow]Falling back to template-based generation.[/yellow]")
-            return self._generate_template_readme(project_info, readme_type)
-
-    def _generate_google_readme(self, project_info: ProjectInfo, readme_type: str) -> str:
+            return [self._generate_template_readme(p, readme_type) for p in projects]
+        return [
+            results.get(f"readme-{i}") or self._generate_template_readme(p, readme_type)
+            for i, p in enumerate(projects)
+        ]
+
+    def _generate_anthropic_batch(self, prompts, poll_interval: float) -> dict:
+        batch = self.anthropic_client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": f"readme-{i}",
+                    "params": {
+                        "model": "claude-3-haiku-20240307",
+                        "max_tokens": 2000,
+                        "temperature": 0.7,
+                        "system": [{"type": "text", "text": self.SYSTEM_PROMPT,
+                                    "cache_control": {"type": "ephemeral"}}],
+                        "messages": [{"role": "user", "content": prompt}]
+                    }
+                }
+                for i, prompt in enumerate(prompts)
+            ]
+        )
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = self.anthropic_client.messages.batches.retrieve(batch.id)
+        results = {}
+        for entry in self.anthropic_client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+            else:
+                console.print(f"[red]Batch entry {entry.custom_id} failed: {entry.result.type}[/red]")
+        return results
+
+    def _generate_openai_batch(self, prompts, poll_interval: float) -> dict:
+        lines = [
+            json.dumps({
+                "custom_id": f"readme-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-3.5-turbo",
+                    "max_tokens": 2000,
+                    "temperature": 0.7,
+                    "messages": [
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ]
+                }
+            })
+            for i, prompt in enumerate(prompts)
+        ]
+        batch_file = self.openai_client.files.create(
+            file=io.BytesIO("\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.openai_client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch ended with status '{batch.status}'")
+        results = {}
+        output = self.openai_client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            body = (entry.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            if choices:
+                results[entry["custom_id"]] = choices[0]["message"]["content"]
+        return results
+
+    @staticmethod
+    def _cache_get(key: str) -> Optional[str]:
         try:
-            # Pre-check: verify Google Gemini model access
-            try:
-                models = self.google_client.list_models()
-                model_names = [m.name for m in models]
-                if "models/gemini-pro" not in model_names:
-                    console.print(f"[red]Google Gemini model 'gemini-pro' is not accessible with your API key.[/red]")
-                    console.print("[yellow]You can test your key with this command:")
-                    console.print("[bold]curl -H 'Authorization: Bearer <your_google_api_key>' 'https://generativelanguage.googleapis.com/v1beta/models?key=<your_google_api_key>'[/bold]")
-                    return self._generate_template_readme(project_info, readme_type)
-            except Exception as e:
-                console.print(f"[red]Google Gemini API key/model check failed: {e}[/red]")
+            with sqlite3.connect(_CACHE_DB) as conn:
+                row = conn.execute("SELECT body FROM cache WHERE key = ?", (key,)).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error:
+            return None
+
+    @staticmethod
+    def _cache_put(key: str, body: str) -> None:
+        try:
+            _CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+            with sqlite3.connect(_CACHE_DB) as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, body TEXT, ts REAL)")
+                conn.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (key, body, time.time()))
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _emit(self, token: str) -> None:
+        if self.on_token:
+            self.on_token(token)
+
+    def _precheck(self, provider: str, credential: str, check: Callable[[], bool]) -> bool:
+        """Run a provider pre-check at most once per TTL window."""
+        key = (provider, credential)
+        cached = self._PRECHECK_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._PRECHECK_TTL:
+            return cached[1]
+        ok = check()
+        self._PRECHECK_CACHE[key] = (time.monotonic(), ok)
+        return ok
+
+    def _precheck_openai(self) -> bool:
+        try:
+            models = self.openai_client.models.list()
+            model_names = [m.id for m in models.data]
+            if "gpt-3.5-turbo" not in model_names:
+                console.print(f"[red]OpenAI model 'gpt-3.5-turbo' is not accessible with your API key.[/red]")
                 console.print("[yellow]You can test your key with this command:")
-                console.print("[bold]curl -H 'Authorization: Bearer <your_google_api_key>' 'https://generativelanguage.googleapis.com/v1beta/models?key=<your_google_api_key>'[/bold]")
-                return self._generate_template_readme(project_info, readme_type)
-            prompt = self._create_ai_prompt(project_info, readme_type)
-            full_prompt = f"{self.SYSTEM_PROMPT}\n\n{prompt}"
-            response = self.google_client.generate_content(full_prompt)
-            return response.text
+                console.print("[bold]curl https://api.openai.com/v1/models -H 'Authorization: Bearer <your_openai_api_key>'[/bold]")
+                return False
+            return True
         except Exception as e:
-            console.print(f"[red]Error generating Google README: {e}[/red]")
-            console.print("[yellow]Falling back to template-based generation.[/yellow]")
-            return self._generate_template_readme(project_info, readme_type)
-
-    def _generate_huggingface_readme(self, project_info: ProjectInfo, readme_type: str) -> str:
+            console.print(f"[red]OpenAI API key/model check failed: {e}[/red]")
+            console.print("[yellow]You can test your key with this command:")
+            console.print("[bold]curl https://api.openai.com/v1/models -H 'Authorization: Bearer <your_openai_api_key>'[/bold]")
+            return False
+
+    def _complete_openai(self, system: str, user: str) -> str:
+        response = self.openai_client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user}
+            ],
+            max_tokens=2000,
+            temperature=0.7,
+            stream=True
+        )
+        parts = []
+        for chunk in response:
+            token = chunk.choices[0].delta.content or ""
+            if token:
+                parts.append(token)
+                self._emit(token)
+        return "".join(parts)
+
+    def _precheck_anthropic(self) -> bool:
         try:
-            # Pre-check: verify model is accessible with the API key
-            api_url = f"https://api-inference.huggingface.co/models/{self.hf_model}"
-            headers = {
-                "Authorization": f"Bearer {self.hf_api_key}",
-                "Content-Type": "application/json"
-            }
-            check_resp = self.hf_client.get(api_url, headers=headers)
-            if check_resp.status_code != 200:
-                console.print(f"[red]Hugging Face model '{self.hf_model}' is not accessible (status {check_resp.status_code}). Please check the model name and your API key.[/red]")
-                try:
-                    error_body = check_resp.json()
-                except Exception:
-                    error_body = check_resp.text
-                console.print(f"[yellow]Hugging Face API response:[/yellow] {error_body}")
-                console.print("[yellow]You can test your model and key with this command:")
-                console.print(f"[bold]curl -H 'Authorization: Bearer <your_hf_api_key>' https://api-inference.huggingface.co/models/{self.hf_model}[/bold]")
-                return self._generate_template_readme(project_info, readme_type)
-            prompt = self._create_ai_prompt(project_info, readme_type)
-            full_prompt = f"{self.SYSTEM_PROMPT}\n\n{prompt}"
-            payload = {
-                "inputs": full_prompt,
-                "parameters": {
-                    "max_new_tokens": 2000,
-                    "temperature": 0.7,
-                    "do_sample": True,
-                    "top_p": 0.95
-                }
-            }
-            response = self.hf_client.post(api_url, headers=headers, json=payload)
-            if response.status_code == 200:
-                result = response.json()
-                if isinstance(result, list) and len(result) > 0:
-                    return result[0].get('generated_text', '')
-                elif isinstance(result, dict):
-                    return result.get('generated_text', '')
-                else:
-                    return str(result)
-            else:
-                console.print(f"[red]Hugging Face API error: {response.status_code}[/red]")
-                return self._generate_template_readme(project_info, readme_type)
+            models = self.anthropic_client.models.list()
+            model_names = [m["id"] for m in models["data"]]
+            if "claude-3-haiku-20240307" not in model_names:
+                console.print(f"[red]Anthropic model 'claude-3-haiku-20240307' is not accessible with your API key.[/red]")
+                console.print("[yellow]You can test your key with this command:")
+                console.print("[bold]curl https://api.anthropic.com/v1/models -H 'x-api-key: <your_anthropic_api_key>'[/bold]")
+                return False
+            return True
         except Exception as e:
-            console.print(f"[red]Error generating Hugging Face README: {e}[/red]")
-            console.print("[yellow]Falling back to template-based generation.[/yellow]")
-            return self._generate_template_readme(project_info, readme_type)
-
-    def _generate_ollama_readme(self, project_info: ProjectInfo, readme_type: str) -> str:
+            console.print(f"[red]Anthropic API key/model check failed: {e}[/red]")
+            console.print("[yellow]You can test your key with this command:")
+            console.print("[bold]curl https://api.anthropic.com/v1/models -H 'x-api-key: <your_anthropic_api_key>'[/bold]")
+            return False
+
+    def _complete_anthropic(self, system: str, user: str) -> str:
+        parts = []
+        with self.anthropic_client.messages.stream(
+            model="claude-3-haiku-20240307",
+            max_tokens=2000,
+            temperature=0.7,
+            system=[{"type": "text", "text": system,
+                     "cache_control": {"type": "ephemeral"}}],
+            messages=[
+                {"role": "user", "content": user}
+            ]
+        ) as stream:
+            for token in stream.text_stream:
+                parts.append(token)
+                self._emit(token)
+        return "".join(parts)
+
+    def _precheck_google(self) -> bool:
         try:
-            # Pre-check: verify Ollama endpoint and model
+            models = self.google_client.list_models()
+            model_names = [m.name for m in models]
+            if "models/gemini-pro" not in model_names:
+                console.print(f"[red]Google Gemini model 'gemini-pro' is not accessible with your API key.[/red]")
+                console.print("[yellow]You can test your key with this command:")
+                console.print("[bold]curl -H 'Authorization: Bearer <your_google_api_key>' 'https://generativelanguage.googleapis.com/v1beta/models?key=<your_google_api_key>'[/bold]")
+                return False
+            return True
+        except Exception as e:
+            console.print(f"[red]Google Gemini API key/model check failed: {e}[/red]")
+            console.print("[yellow]You can test your key with this command:")
+            console.print("[bold]curl -H 'Authorization: Bearer <your_google_api_key>' 'https://generativelanguage.googleapis.com/v1beta/models?key=<your_google_api_key>'[/bold]")
+            return False
+
+    def _complete_google(self, system: str, user: str) -> str:
+        response = self.google_client.generate_content(f"{system}\n\n{user}")
+        return response.text
+
+    def _precheck_huggingface(self) -> bool:
+        api_url = f"https://api-inference.huggingface.co/models/{self.hf_model}"
+        check_resp = self.hf_client.get(api_url, headers=self._hf_headers)
+        if check_resp.status_code != 200:
+            console.print(f"[red]Hugging Face model '{self.hf_model}' is not accessible (status {check_resp.status_code}). Please check the model name and your API key.[/red]")
             try:
-                tags_resp = self.ollama_client.get(f"{self.ollama_endpoint}/api/tags")
-                if tags_resp.status_code != 200:
-                    console.print(f"[red]Ollama endpoint '{self.ollama_endpoint}' is not accessible (status {tags_resp.status_code}).[/red]")
-                    console.print(f"[yellow]Ollama API response:[/yellow] {tags_resp.text}")
-                    console.print("[yellow]You can test your endpoint with this command:")
-                    console.print(f"[bold]curl {self.ollama_endpoint}/api/tags[/bold]")
-                    return self._generate_template_readme(project_info, readme_type)
-                tags = tags_resp.json().get('models', [])
-                model_names = [t['name'] for t in tags]
-                if "codellama:7b-instruct" not in model_names:
-                    console.print(f"[red]Ollama model 'codellama:7b-instruct' is not available at your endpoint.[/red]")
-                    console.print("[yellow]You can test your endpoint with this command:")
-                    console.print(f"[bold]curl {self.ollama_endpoint}/api/tags[/bold]")
-                    return self._generate_template_readme(project_info, readme_type)
-            except Exception as e:
-                console.print(f"[red]Ollama endpoint/model check failed: {e}[/red]")
+                error_body = check_resp.json()
+            except Exception:
+                error_body = check_resp.text
+            console.print(f"[yellow]Hugging Face API response:[/yellow] {error_body}")
+            console.print("[yellow]You can test your model and key with this command:")
+            console.print(f"[bold]curl -H 'Authorization: Bearer <your_hf_api_key>' https://api-inference.huggingface.co/models/{self.hf_model}[/bold]")
+            return False
+        return True
+
+    def _complete_huggingface(self, system: str, user: str) -> str:
+        api_url = f"https://api-inference.huggingface.co/models/{self.hf_model}"
+        payload = {
+            "inputs": f"{system}\n\n{user}",
+            "parameters": {
+                "max_new_tokens": 2000,
+                "temperature": 0.7,
+                "do_sample": True,
+                "top_p": 0.95
+            }
+        }
+        body = orjson.dumps(payload)
+        for attempt in range(_RETRY_TOTAL + 1):
+            response = self.hf_client.post(api_url, content=body, headers=self._hf_headers)
+            if response.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                break
+            time.sleep(_retry_delay(response, attempt))
+        if response.status_code != 200:
+            raise RuntimeError(f"Hugging Face API error: {response.status_code}")
+        result = orjson.loads(response.content)
+        if isinstance(result, list) and len(result) > 0:
+            return result[0].get('generated_text', '')
+        elif isinstance(result, dict):
+            return result.get('generated_text', '')
+        return str(result)
+
+    def _precheck_ollama(self) -> bool:
+        try:
+            tags_resp = self.ollama_client.get(f"{self.ollama_endpoint}/api/tags")
+            if tags_resp.status_code != 200:
+                console.print(f"[red]Ollama endpoint '{self.ollama_endpoint}' is not accessible (status {tags_resp.status_code}).[/red]")
+                console.print(f"[yellow]Ollama API response:[/yellow] {tags_resp.text}")
                 console.print("[yellow]You can test your endpoint with this command:")
                 console.print(f"[bold]curl {self.ollama_endpoint}/api/tags[/bold]")
-                return self._generate_template_readme(project_info, readme_type)
-            prompt = self._create_ai_prompt(project_info, readme_type)
-            full_prompt = f"{self.SYSTEM_PROMPT}\n\n{prompt}"
-            api_url = f"{self.ollama_endpoint}/api/generate"
-            payload = {
-                "model": "codellama:7b-instruct",
-                "prompt": full_prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.7,
-                    "top_p": 0.95,
-                    "num_predict": 2000
-                }
-            }
-            response = self.ollama_client.post(api_url, json=payload)
-            if response.status_code == 200:
-                result = response.json()
-                return result.get('response', '')
-            else:
-                console.print(f"[red]Ollama API error: {response.status_code}[/red]")
-                return self._generate_template_readme(project_info, readme_type)
+                return False
+            tags = orjson.loads(tags_resp.content).get('models', [])
+            model_names = [t['name'] for t in tags]
+            if "codellama:7b-instruct" not in model_names:
+                console.print(f"[red]Ollama model 'codellama:7b-instruct' is not available at your endpoint.[/red]")
+                console.print("[yellow]You can test your endpoint with this command:")
+                console.print(f"[bold]curl {self.ollama_endpoint}/api/tags[/bold]")
+                return False
+            return True
         except Exception as e:
-            console.print(f"[red]Error generating Ollama README: {e}[/red]")
-            console.print("[yellow]Falling back to template-based generation.[/yellow]")
-            return self._generate_template_readme(project_info, readme_type)
+            console.print(f"[red]Ollama endpoint/model check failed: {e}[/red]")
+            console.print("[yellow]You can test your endpoint with this command:")
+            console.print(f"[bold]curl {self.ollama_endpoint}/api/tags[/bold]")
+            return False
+
+    def _complete_ollama(self, system: str, user: str) -> str:
+        api_url = f"{self.ollama_endpoint}/api/generate"
+        payload = {
+            "model": "codellama:7b-instruct",
+            "prompt": f"{system}\n\n{user}",
+            "stream": True,
+            "options": {
+                "temperature": 0.7,
+                "top_p": 0.95,
+                "num_predict": 2000
+            }
+        }
+        body = orjson.dumps(payload)
+        for attempt in range(_RETRY_TOTAL + 1):
+            with self.ollama_client.stream(
+                "POST", api_url,
+                content=body,
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                if response.status_code in _RETRY_STATUSES and attempt < _RETRY_TOTAL:
+                    delay = _retry_delay(response, attempt)
+                elif response.status_code != 200:
+                    raise RuntimeError(f"Ollama API error: {response.status_code}")
+                else:
+                    parts = []
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        frame = orjson.loads(line)
+                        token = frame.get('response', '')
+                        if token:
+                            parts.append(token)
+                            self._emit(token)
+                        if frame.get('done'):
+                            break
+                    return "".join(parts)
+            time.sleep(delay)
+        raise RuntimeError(f"Ollama API error: {response.status_code}")
 
     def _create_ai_prompt(self, project_info: ProjectInfo, readme_type: str) -> str:
         type_instructions = {
@@ -264,7 +781,14 @@ class READMEGenerator:
                 "Use step-by-step instructions, code blocks, and highlight common pitfalls."
             )
         }
+        # Invariant instructions lead the prompt so that, together with the
+        # system prompt, the cacheable prefix is as long as possible for
+        # providers with server-side prompt caching; only the trailing
+        # project data varies between calls.
         return f"""
+Requirements:
+{type_instructions.get(readme_type, type_instructions['advanced'])}
+
 Project Name: {project_info.name}
 Description: {project_info.description}
 Language: {project_info.language}
@@ -275,253 +799,59 @@ Has Documentation: {project_info.has_docs}
 Has License: {project_info.has_license}
 
 Project Structure:
-- Source directories: {project_info.structure['src_dirs']}
-- Configuration files: {project_info.structure['config_files']}
-- Test directories: {project_info.structure['test_dirs']}
+- Source directories: {_cap_join(project_info.structure['src_dirs'])}
+- Configuration files: {_cap_join(project_info.structure['config_files'])}
+- Test directories: {_cap_join(project_info.structure['test_dirs'])}
 
-Key Files: {project_info.files[:10]}
-
-Requirements:
-{type_instructions.get(readme_type, type_instructions['advanced'])}
+Key Files: {_cap_join(project_info.files)}
 """
 
     def _generate_template_readme(self, project_info: ProjectInfo, readme_type: str) -> str:
+        ctx = self._render_ctx(project_info)
         if readme_type == "simple":
-            return self._simple_template(project_info)
+            return self._simple_template(project_info, ctx)
         elif readme_type == "installation":
-            return self._installation_template(project_info)
+            return self._installation_template(project_info, ctx)
         else:
-            return self._advanced_template(project_info)
-
-    def _simple_template(self, project_info: ProjectInfo) -> str:
-        return f"""# {project_info.name}
-
-{project_info.description}
-
-## Installation
-
-```bash
-# Clone the repository
-git clone <repository-url>
-cd {project_info.name}
-
-# Install dependencies
-{self._get_install_command(project_info)}
-```
-
-## Usage
-
-```bash
-# Run the project
-{self._get_run_command(project_info)}
-```
-
-## License
-
-This project is licensed under the MIT License.
-"""
-
-    def _installation_template(self, project_info: ProjectInfo) -> str:
-        return f"""# {project_info.name}
-
-{project_info.description}
-
-## Prerequisites
-
-- {project_info.language}
-{f'- {project_info.framework}' if project_info.framework else ''}
-
-## Installation
-
-### Step 1: Clone the Repository
-
-```bash
-git clone <repository-url>
-cd {project_info.name}
-```
-
-### Step 2: Install Dependencies
-
-```bash
-{self._get_install_command(project_info)}
-```
-
-### Step 3: Configuration
-
-{self._get_configuration_section(project_info)}
-
-### Step 4: Verify Installation
-
-```bash
-{self._get_verify_command(project_info)}
-```
-
-## Troubleshooting
-
-### Common Issues
-
-1. **Dependency conflicts**: Try updating your package manager
-2. **Permission errors**: Use `sudo` for system-wide installation
-3. **Path issues**: Ensure the project is in your PATH
-
-### Getting Help
-
-If you encounter issues:
-1. Check the [Issues](link-to-issues) page
-2. Review the documentation
-3. Contact the maintainers
-
-## License
-
-This project is licensed under the MIT License.
-"""
-
-    def _advanced_template(self, project_info: ProjectInfo) -> str:
-        # Language icons
-        lang_icons = {
-            'Python': '🐍',
-            'JavaScript/TypeScript': '⚡️',
-            'Java': '☕',
-            'C/C++': '💻',
-            'Go': '🦦',
-            'Rust': '🦀',
-            'Ruby': '💎',
-            'PHP': '🐘',
-            'Unknown': '❓'
-        }
-        lang_icon = lang_icons.get(project_info.language, '❓')
+            return self._advanced_template(project_info, ctx)
+
+    def _render_ctx(self, project_info: ProjectInfo) -> RenderCtx:
+        commands = LANG_COMMANDS.get(project_info.language, _DEFAULT_COMMANDS)
+        run = commands['run']
+        test = commands['test']
+        return RenderCtx(
+            name=project_info.name,
+            deps_head=", ".join(project_info.dependencies[:5]),
+            install=commands['install'],
+            run=run,
+            test=test,
+            dev_install=commands['dev_install'],
+            verify=test if project_info.has_tests else f"{run} --version",
+            config_section=self._get_configuration_section(project_info),
+        )
+
+    def _simple_template(self, project_info: ProjectInfo, ctx: RenderCtx) -> str:
+        return _SIMPLE_TPL.render(p=project_info, ctx=ctx)
+
+    def _installation_template(self, project_info: ProjectInfo, ctx: RenderCtx) -> str:
+        return _INSTALLATION_TPL.render(p=project_info, ctx=ctx)
+
+    def _advanced_template(self, project_info: ProjectInfo, ctx: RenderCtx) -> str:
+        lang_icon = _LANG_ICONS.get(project_info.language, '\u2753')
         framework = f" | {project_info.framework}" if project_info.framework and project_info.framework != project_info.language else ""
-        # Badges (example)
-        badges = f"""
-![License](https://img.shields.io/badge/license-MIT-green.svg)
-![Language](https://img.shields.io/badge/language-{project_info.language.replace(' ', '%20')}-blue.svg)
-"""
         # Tech stack
         tech_stack = f"{lang_icon} {project_info.language}{framework}"
-        if project_info.dependencies:
-            tech_stack += " | " + ", ".join(project_info.dependencies[:5])
-        return f"""# {project_info.name}
-
-{badges}
-
-{project_info.description}
-
-## 🚀 Table of Contents
-- [Features](#features)
-- [Getting Started](#getting-started)
-- [Installation](#installation)
-- [Usage](#usage)
-- [Configuration](#configuration)
-- [Tech Stack](#tech-stack)
-- [Screenshots](#screenshots)
-- [API Reference](#api-reference)
-- [Contributing](#contributing)
-- [Contact](#contact)
-- [License](#license)
-
-## ✨ Features
-- **Modern {project_info.language}**: Built with the latest {project_info.language} features
-{f'- **{project_info.framework} Integration**: Leverages {project_info.framework} for enhanced functionality' if project_info.framework else ''}
-- **Comprehensive Testing**: {project_info.has_tests and 'Includes unit and integration tests' or 'Test coverage planned'}
-- **Documentation**: {project_info.has_docs and 'Complete documentation included' or 'Documentation in development'}
-
-## 🏁 Getting Started
-
-Follow these steps to get your development environment set up:
-
-1. **Clone the repository**
-   ```bash
-   git clone <repository-url>
-   cd {project_info.name}
-   ```
-2. **Install dependencies**
-   ```bash
-   {self._get_install_command(project_info)}
-   ```
-3. **Run the application**
-   ```bash
-   {self._get_run_command(project_info)}
-   ```
-
-## ⚙️ Installation
-
-### Requirements
-- {lang_icon} {project_info.language} 3.8+{f' | {project_info.framework}' if project_info.framework else ''}
-
-### Quick Start
-```bash
-# Clone the repository
-git clone <repository-url>
-cd {project_info.name}
-
-# Install dependencies
-{self._get_install_command(project_info)}
-
-# Run the application
-{self._get_run_command(project_info)}
-```
-
-## 🛠️ Usage
-
-### Basic Usage
-```bash
-{self._get_basic_usage(project_info)}
-```
-
-### Advanced Configuration
-{self._get_configuration_section(project_info)}
-
-## 🧰 Tech Stack
-- {tech_stack}
-
-## 📸 Screenshots
-Add screenshots here:
-```
-![Screenshot 1](link-to-screenshot-1)
-![Screenshot 2](link-to-screenshot-2)
-```
-
-## 📚 API Reference
-{self._get_api_reference(project_info)}
-
-## 🤝 Contributing
-We welcome contributions! Please see our [Contributing Guide](CONTRIBUTING.md) for details.
-
-### Development Setup
-```bash
-# Clone the repository
-git clone <repository-url>
-cd {project_info.name}
-
-# Install development dependencies
-{self._get_dev_install_command(project_info)}
-
-# Run tests
-{self._get_test_command(project_info)}
-```
-
-## 📬 Contact
-For questions, suggestions, or support, please open an issue or contact the maintainers.
-
-## 📝 License
-This project is licensed under the MIT License - see the [LICENSE](LICENSE) file for details.
-"""
-
-    def _get_install_command(self, project_info: ProjectInfo) -> str:
-        if project_info.language == 'Python':
-            return "pip install -r requirements.txt"
-        elif project_info.language == 'JavaScript/TypeScript':
-            return "npm install"
-        else:
-            return "# Install dependencies based on your project type"
-
-    def _get_run_command(self, project_info: ProjectInfo) -> str:
-        if project_info.language == 'Python':
-            return "python main.py"
-        elif project_info.language == 'JavaScript/TypeScript':
-            return "npm start"
-        else:
-            return "# Run the application based on your project type"
+        if ctx.deps_head:
+            tech_stack += " | " + ctx.deps_head
+        return _ADVANCED_TPL.render(
+            p=project_info,
+            ctx=ctx,
+            lang_icon=lang_icon,
+            badges=_lang_badge(project_info.language),
+            tech_stack=tech_stack,
+            basic_usage=self._get_basic_usage(ctx),
+            api_reference=self._get_api_reference(project_info),
+        )
 
     def _get_configuration_section(self, project_info: ProjectInfo) -> str:
         if project_info.structure['config_files']:
@@ -536,35 +866,13 @@ Edit these files to customize the application behavior.
 Configuration can be done through environment variables or by editing the source code.
 """
 
-    def _get_verify_command(self, project_info: ProjectInfo) -> str:
-        if project_info.has_tests:
-            return self._get_test_command(project_info)
-        else:
-            return f"{self._get_run_command(project_info)} --version"
-
-    def _get_test_command(self, project_info: ProjectInfo) -> str:
-        if project_info.language == 'Python':
-            return "python -m pytest"
-        elif project_info.language == 'JavaScript/TypeScript':
-            return "npm test"
-        else:
-            return "# Run tests based on your project type"
-
-    def _get_dev_install_command(self, project_info: ProjectInfo) -> str:
-        if project_info.language == 'Python':
-            return "pip install -r requirements-dev.txt"
-        elif project_info.language == 'JavaScript/TypeScript':
-            return "npm install --include=dev"
-        else:
-            return self._get_install_command(project_info)
-
-    def _get_basic_usage(self, project_info: ProjectInfo) -> str:
+    def _get_basic_usage(self, ctx: RenderCtx) -> str:
         return f"""
 # Basic usage
-{self._get_run_command(project_info)}
+{ctx.run}
 
 # With options
-{self._get_run_command(project_info)} --help
+{ctx.run} --help
 """
 
     def _get_api_reference(self, project_info: ProjectInfo) -> str:
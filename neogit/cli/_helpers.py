@@ -0,0 +1,38 @@
+from typing import Optional, Tuple
+
+from rich.console import Console
+
+from neogit.utils.prompt_utils import select_menu
+
+console = Console()
+
+PROVIDER_ORDER = ["openai", "anthropic", "google", "huggingface", "ollama"]
+
+
+def select_ai_provider(ai_providers) -> Tuple[Optional[dict], Optional[str]]:
+    """Prompt for an AI provider among the configured ones.
+
+    Returns `({provider: config}, selected_provider)`, or `(None, None)`
+    when nothing is configured (after printing the error), so callers
+    can simply bail out. Shared by generate-readme and run.
+    """
+    available_providers = []
+    provider_labels = []
+    for prov in PROVIDER_ORDER:
+        val = getattr(ai_providers, prov, None)
+        if prov == "huggingface" and val:
+            available_providers.append(prov)
+            provider_labels.append(f"Hugging Face (model: {val.default_model})")
+        elif val:
+            available_providers.append(prov)
+            provider_labels.append(f"{prov.capitalize()} (key set)")
+    if not available_providers:
+        console.print("[red]No AI providers configured. Please run setup or reconfigure.[/red]")
+        return None, None
+    if len(available_providers) == 1:
+        selected_provider = available_providers[0]
+    else:
+        selected_label = select_menu("\U0001F916 Select AI provider", provider_labels)
+        selected_provider = available_providers[provider_labels.index(selected_label)]
+    providers = {prov: getattr(ai_providers, prov, None) for prov in available_providers}
+    return providers, selected_provider
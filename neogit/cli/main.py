@@ -1,11 +1,10 @@
 import rich_click as click
 click.rich_click.MAX_WIDTH = 100
 click.rich_click.USE_RICH_MARKUP = True
-import requests
 from neogit.ai.project_analyzer import ProjectAnalyzer
 from rich.prompt import Prompt
 from rich.progress import Progress
-from neogit.config.manager import ConfigManager
+from neogit.config.manager import ConfigManager, get_config_manager
 from neogit.github.manager import GitHubManager, deploy_to_github
 from neogit.ai.readme_generator import READMEGenerator
 from rich.console import Console
@@ -13,6 +12,8 @@ from rich.panel import Panel
 from rich.text import Text
 from pathlib import Path
 from neogit.utils.prompt_utils import ascii_banner, select_menu, confirm_menu, text_input
+from neogit.utils.gitignore_utils import fetch_gitignore, missing_patterns
+from neogit.cli._helpers import select_ai_provider
 
 console = Console()
 
@@ -49,7 +50,7 @@ def cli():
 
 @cli.command(help="Interactive setup for NeoGit configuration (GitHub, AI providers, etc.)")
 def setup():
-    ConfigManager().setup()
+    get_config_manager().setup()
 
 @cli.command(name="generate-readme", help="Analyze your project and generate a professional README.md using an AI provider.")
 def generate_readme():
@@ -57,27 +58,11 @@ def generate_readme():
     project_path = text_input("\U0001F4C1 Project path (enter '.' for current directory)")
     project_path = Path(project_path.strip()).expanduser().resolve()
     readme_type = select_menu("\U0001F4C4 README type", ["simple", "advanced", "installation"])
-    config = ConfigManager()
+    config = get_config_manager()
     settings = config.load_config()
-    ai_providers = settings.ai_providers
-    available_providers = []
-    provider_labels = []
-    for prov in ["openai", "anthropic", "google", "huggingface", "ollama"]:
-        val = getattr(ai_providers, prov, None)
-        if prov == "huggingface" and val:
-            available_providers.append(prov)
-            provider_labels.append(f"Hugging Face (model: {val.default_model})")
-        elif val:
-            available_providers.append(prov)
-            provider_labels.append(f"{prov.capitalize()} (key set)")
-    if not available_providers:
-        console.print("[red]No AI providers configured. Please run setup or reconfigure.[/red]")
+    providers, selected_provider = select_ai_provider(settings.ai_providers)
+    if providers is None:
         return
-    if len(available_providers) == 1:
-        selected_provider = available_providers[0]
-    else:
-        selected_label = select_menu("\U0001F916 Select AI provider", provider_labels)
-        selected_provider = available_providers[provider_labels.index(selected_label)]
 
     if not project_path.exists():
         console.print(f"[red]Project path {project_path} does not exist.[/red]")
@@ -87,7 +72,7 @@ def generate_readme():
     project_info = analyzer.analyze()
 
     generator = READMEGenerator(
-        ai_providers={prov: getattr(ai_providers, prov, None) for prov in available_providers},
+        ai_providers=providers,
         selected_provider=selected_provider
     )
     readme_content = generator.generate_readme(project_info, readme_type)
@@ -96,6 +81,35 @@ def generate_readme():
         f.write(readme_content)
     console.print(f"[green]README.md generated at {readme_path}! \U0001F389[/green]")
 
+@cli.command(name="generate-readme-batch", help="Generate READMEs for several projects at once through the provider's Batch API (half token cost on OpenAI/Anthropic).")
+@click.argument('project_paths', nargs=-1, required=True)
+@click.option('--readme-type', type=click.Choice(['simple', 'advanced', 'installation']), default='advanced', show_default=True, help="README style to generate for every project.")
+def generate_readme_batch(project_paths, readme_type):
+    ascii_banner()
+    paths = [Path(p).expanduser().resolve() for p in project_paths]
+    missing = [p for p in paths if not p.exists()]
+    if missing:
+        for p in missing:
+            console.print(f"[red]Project path {p} does not exist.[/red]")
+        return
+    config = get_config_manager()
+    settings = config.load_config()
+    providers, selected_provider = select_ai_provider(settings.ai_providers)
+    if providers is None:
+        return
+    project_infos = [ProjectAnalyzer(p).analyze() for p in paths]
+    generator = READMEGenerator(
+        ai_providers=providers,
+        selected_provider=selected_provider
+    )
+    console.print(f"[yellow]Submitting batch job for {len(paths)} project(s)...[/yellow]")
+    readmes = generator.generate_readmes_batch(project_infos, readme_type)
+    for path, content in zip(paths, readmes):
+        readme_path = path / 'README.md'
+        with open(readme_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        console.print(f"[green]README.md generated at {readme_path}! \U0001F389[/green]")
+
 @cli.command(help="Deploy your project and generated README.md to GitHub.")
 def deploy():
     ascii_banner()
@@ -107,27 +121,11 @@ def run():
     project_path = text_input("\U0001F4C1 Project path (enter '.' for current directory)")
     project_path = Path(project_path.strip()).expanduser().resolve()
     readme_type = select_menu("\U0001F4C4 README type", ["simple", "advanced", "installation"])
-    config = ConfigManager()
+    config = get_config_manager()
     settings = config.load_config()
-    ai_providers = settings.ai_providers
-    available_providers = []
-    provider_labels = []
-    for prov in ["openai", "anthropic", "google", "huggingface", "ollama"]:
-        val = getattr(ai_providers, prov, None)
-        if prov == "huggingface" and val:
-            available_providers.append(prov)
-            provider_labels.append(f"Hugging Face (model: {val.default_model})")
-        elif val:
-            available_providers.append(prov)
-            provider_labels.append(f"{prov.capitalize()} (key set)")
-    if not available_providers:
-        console.print("[red]No AI providers configured. Please run setup or reconfigure.[/red]")
+    providers, selected_provider = select_ai_provider(settings.ai_providers)
+    if providers is None:
         return
-    if len(available_providers) == 1:
-        selected_provider = available_providers[0]
-    else:
-        selected_label = select_menu("\U0001F916 Select AI provider", provider_labels)
-        selected_provider = available_providers[provider_labels.index(selected_label)]
 
     github_token = settings.github.token
     github_username = settings.github.username
@@ -140,6 +138,10 @@ def run():
         console.print(f"[red]Project path {project_path} does not exist.[/red]")
         return
 
+    # One analysis pass serves the gitignore update and README generation.
+    analyzer = ProjectAnalyzer(project_path)
+    project_info = analyzer.analyze()
+
     # Ensure .gitignore is present and up-to-date
     gitignore_path = project_path / '.gitignore'
     required_patterns = ['mcp_client.config', '.env', '*.secret', '.venv', 'node_modules']
@@ -147,52 +149,35 @@ def run():
     if not gitignore_path.exists():
         needs_update = True
     else:
-        with open(gitignore_path, 'r') as f:
-            content = f.read()
-        for pattern in required_patterns:
-            if pattern not in content:
-                needs_update = True
-                break
+        needs_update = bool(missing_patterns(gitignore_path.read_text(), required_patterns))
     if needs_update:
         console.print("[yellow]Ensuring .gitignore is present and up-to-date...[/yellow]")
         # Use the same logic as create-gitignore
-        try:
-            analyzer = ProjectAnalyzer(project_path)
-            project_info = analyzer.analyze()
-            detected = project_info.language.lower() if project_info.language else "python"
-        except Exception:
-            detected = "python"
+        detected = project_info.language.lower() if project_info.language else "python"
         techs = detected
-        url = f"https://www.toptal.com/developers/gitignore/api/{techs}"
         with Progress() as progress:
             task = progress.add_task("Fetching from gitignore.io...", total=1)
             try:
-                resp = requests.get(url)
+                content = fetch_gitignore(techs).rstrip()
                 progress.update(task, advance=1)
-                if resp.status_code == 200:
-                    content = resp.text.rstrip()
-                    if 'mcp_client.config' not in content:
-                        content += '\n# NeoGit config file\nmcp_client.config'
-                    for pattern in required_patterns[1:]:
-                        if pattern not in content:
-                            content += f"\n{pattern}"
-                    content += '\n'
-                    with open(gitignore_path, 'w') as f:
-                        f.write(content)
-                    console.print(f"[green].gitignore created/updated at {gitignore_path}![/green]")
-                else:
-                    console.print(f"[red]Failed to fetch .gitignore (status {resp.status_code})[/red]")
+                missing = missing_patterns(content, required_patterns)
+                if 'mcp_client.config' in missing:
+                    content += '\n# NeoGit config file\nmcp_client.config'
+                for pattern in missing:
+                    if pattern != 'mcp_client.config':
+                        content += f"\n{pattern}"
+                content += '\n'
+                with open(gitignore_path, 'w') as f:
+                    f.write(content)
+                console.print(f"[green].gitignore created/updated at {gitignore_path}![/green]")
             except Exception as e:
                 console.print(f"[red]Error fetching .gitignore: {e}[/red]")
 
     branch = select_menu("\U0001F33F Branch to upload to", ["main", "side"])
     private = confirm_menu("\U0001F512 Should the repository be private?", default=False)
 
-    analyzer = ProjectAnalyzer(project_path)
-    project_info = analyzer.analyze()
-
     generator = READMEGenerator(
-        ai_providers={prov: getattr(ai_providers, prov, None) for prov in available_providers},
+        ai_providers=providers,
         selected_provider=selected_provider
     )
     readme_content = generator.generate_readme(project_info, readme_type)
@@ -208,7 +193,7 @@ def run():
 @cli.command(help="Re-run the interactive setup to reconfigure NeoGit.")
 def reconfigure():
     ascii_banner()
-    ConfigManager().setup()
+    get_config_manager().setup()
 
 @cli.command(help="Create a .gitignore file for your project based on its main language and tools. Always protects common secrets and config files.")
 def create_gitignore():
@@ -228,30 +213,24 @@ def create_gitignore():
     console.print(f"[cyan]Detected main language:[/cyan] [bold]{detected}[/bold]")
     techs = Prompt.ask("Enter comma-separated technologies/tools for .gitignore (or press Enter to use detected)", default=detected)
     techs = techs.replace(' ', '').lower()
-    url = f"https://www.toptal.com/developers/gitignore/api/{techs}"
     console.print(f"[yellow]Fetching .gitignore for: {techs} ...[/yellow]")
     with Progress() as progress:
         task = progress.add_task("Fetching from gitignore.io...", total=1)
         try:
-            resp = requests.get(url)
+            content = fetch_gitignore(techs).rstrip()
             progress.update(task, advance=1)
-            if resp.status_code == 200:
-                gitignore_path = project_path / '.gitignore'
-                content = resp.text.rstrip()
-                # Always append mcp_client.config if not present
-                if 'mcp_client.config' not in content:
-                    content += '\n# NeoGit config file\nmcp_client.config'
-                # Always append .env, *.secret, .venv, node_modules if not present
-                always_patterns = ['.env', '*.secret', '.venv', 'node_modules']
-                for pattern in always_patterns:
-                    if pattern not in content:
-                        content += f"\n{pattern}"
-                content += '\n'
-                with open(gitignore_path, 'w') as f:
-                    f.write(content)
-                console.print(f"[green].gitignore created at {gitignore_path}![/green]")
-            else:
-                console.print(f"[red]Failed to fetch .gitignore (status {resp.status_code})[/red]")
+            gitignore_path = project_path / '.gitignore'
+            # Always protect config, secrets and environment dirs
+            missing = missing_patterns(content, ['mcp_client.config', '.env', '*.secret', '.venv', 'node_modules'])
+            if 'mcp_client.config' in missing:
+                content += '\n# NeoGit config file\nmcp_client.config'
+            for pattern in missing:
+                if pattern != 'mcp_client.config':
+                    content += f"\n{pattern}"
+            content += '\n'
+            with open(gitignore_path, 'w') as f:
+                f.write(content)
+            console.print(f"[green].gitignore created at {gitignore_path}![/green]")
         except Exception as e:
             console.print(f"[red]Error fetching .gitignore: {e}[/red]")
 
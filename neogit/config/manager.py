@@ -1,3 +1,18 @@
+from functools import lru_cache
+
 from neogit.server.server import ConfigManager
- 
-__all__ = ["ConfigManager"] 
\ No newline at end of file
+
+
+@lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Process-wide ConfigManager instance.
+
+    load_config caches its parsed AppConfig on the instance, so sharing
+    one manager means the YAML is read at most once per CLI invocation
+    no matter how many commands touch the config. setup() refreshes the
+    instance's cached config on save, keeping the singleton coherent.
+    """
+    return ConfigManager()
+
+
+__all__ = ["ConfigManager", "get_config_manager"]
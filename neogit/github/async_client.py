@@ -0,0 +1,102 @@
+import asyncio
+import binascii
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+import httpx
+import orjson
+
+API_BASE = "https://api.github.com"
+
+# GitHub's secondary rate limiting trips on aggressive write bursts;
+# eight in-flight requests stays comfortably under it.
+MAX_IN_FLIGHT = 8
+
+
+class AsyncGitHubClient:
+    """Thin async wrapper over the GitHub REST v3 write endpoints.
+
+    PyGithub serializes every call on one blocking session, so a deploy
+    of many small files pays one round-trip each. This client overlaps
+    those round-trips on a single event loop via httpx.AsyncClient.
+    Use it for contents-API deploys that want one commit per file; the
+    default tree-based path in GitHubManager already batches everything
+    into a single commit and stays on the sync client.
+    """
+
+    def __init__(self, token: str, username: str):
+        self.token = token
+        self.username = username
+        self._client = httpx.AsyncClient(
+            base_url=API_BASE,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=16),
+            headers={
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github+json",
+            },
+            timeout=60,
+        )
+        self._sem = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def put_contents(self, repo: str, path: str, content_b64: str,
+                           message: str, branch: str = 'main',
+                           sha: Optional[str] = None) -> dict:
+        """PUT /repos/{user}/{repo}/contents/{path} — create or update one file."""
+        payload = {"message": message, "content": content_b64, "branch": branch}
+        if sha:
+            payload["sha"] = sha
+        async with self._sem:
+            resp = await self._client.put(
+                f"/repos/{self.username}/{repo}/contents/{path}",
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    async def create_blob(self, repo: str, content_b64: str) -> str:
+        """POST /repos/{user}/{repo}/git/blobs — returns the blob sha."""
+        payload = {"content": content_b64, "encoding": "base64"}
+        async with self._sem:
+            resp = await self._client.post(
+                f"/repos/{self.username}/{repo}/git/blobs",
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
+        resp.raise_for_status()
+        return orjson.loads(resp.content)["sha"]
+
+    async def upload_files(self, repo: str, items: Iterable[Tuple[Path, str]],
+                           branch: str = 'main') -> List:
+        """Fan out contents-API PUTs for `(file_path, rel_path)` pairs.
+
+        Returns per-file results in input order; failures come back as
+        the raised exception rather than aborting the batch.
+        """
+
+        async def _one(file_path: Path, rel_path: str):
+            content = await asyncio.to_thread(file_path.read_bytes)
+            b64 = binascii.b2a_base64(content, newline=False).decode('ascii')
+            return await self.put_contents(repo, rel_path, b64, f"Add {rel_path}", branch)
+
+        return await asyncio.gather(
+            *(_one(fp, rp) for fp, rp in items), return_exceptions=True
+        )
+
+
+def upload_files(token: str, username: str, repo: str,
+                 items: Iterable[Tuple[Path, str]], branch: str = 'main') -> List:
+    """Sync entry point: drive AsyncGitHubClient.upload_files via asyncio.run."""
+
+    async def _run():
+        client = AsyncGitHubClient(token, username)
+        try:
+            return await client.upload_files(repo, items, branch)
+        finally:
+            await client.aclose()
+
+    return asyncio.run(_run())
@@ -0,0 +1,86 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import httpx
+import orjson
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Trees nest one level per path component; eight levels covers virtually
+# any project layout. Blobs deeper than that just miss the skip map and
+# get uploaded normally.
+_TREE_DEPTH = 8
+
+
+def _tree_selection(depth: int) -> str:
+    sel = "entries { name type oid }"
+    for _ in range(depth - 1):
+        sel = "entries { name type oid object { ... on Tree { %s } } }" % sel
+    return sel
+
+
+_QUERY = """
+query($owner: String!, $name: String!, $ref: String!) {
+  repository(owner: $owner, name: $name) {
+    ref(qualifiedName: $ref) {
+      target {
+        ... on Commit {
+          oid
+          tree { oid %s }
+        }
+      }
+    }
+  }
+}
+""" % _tree_selection(_TREE_DEPTH)
+
+
+@dataclass
+class BranchState:
+    """Head commit plus the full blob map of one branch."""
+    commit_oid: str
+    tree_oid: str
+    blobs: Dict[str, str] = field(default_factory=dict)
+
+
+def _collect_blobs(entries, prefix: str, blobs: Dict[str, str]):
+    for entry in entries or []:
+        path = f"{prefix}{entry['name']}"
+        if entry['type'] == 'blob':
+            blobs[path] = entry['oid']
+        elif entry['type'] == 'tree':
+            sub = entry.get('object') or {}
+            _collect_blobs(sub.get('entries'), f"{path}/", blobs)
+
+
+def fetch_branch_state(token: str, owner: str, name: str, branch: str,
+                       timeout: float = 30.0) -> Optional[BranchState]:
+    """Fetch ref, head commit and recursive tree in one GraphQL round-trip.
+
+    Replaces the REST ref -> commit -> recursive-tree chain (three
+    sequential RTTs) with a single POST. Returns None when the branch
+    does not exist, so callers can fall back to their branch-creation
+    path; HTTP-level failures propagate.
+    """
+    resp = httpx.post(
+        GRAPHQL_URL,
+        content=orjson.dumps({
+            "query": _QUERY,
+            "variables": {"owner": owner, "name": name, "ref": f"refs/heads/{branch}"},
+        }),
+        headers={
+            "Authorization": f"bearer {token}",
+            "Content-Type": "application/json",
+        },
+        timeout=timeout,
+    )
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    if data.get("errors"):
+        raise RuntimeError(data["errors"][0].get("message", "GraphQL query failed"))
+    target = (((data.get("data") or {}).get("repository") or {}).get("ref") or {}).get("target")
+    if not target or "oid" not in target:
+        return None
+    blobs: Dict[str, str] = {}
+    _collect_blobs(target["tree"].get("entries"), "", blobs)
+    return BranchState(commit_oid=target["oid"], tree_oid=target["tree"]["oid"], blobs=blobs)
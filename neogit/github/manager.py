@@ -1,18 +1,34 @@
 from github import Github
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.console import Console
-import base64
+import binascii
+import hashlib
+import io
 import os
 from neogit.utils.file_utils import is_binary
+from neogit.github.graphql import fetch_branch_state
 from github import InputGitTreeElement
-import mimetypes
+import time
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 from rich.prompt import Prompt
+from rich.table import Table
 
 console = Console()
 
-EXCLUDE_PATTERNS = ['.git', 'node_modules', '__pycache__', 'venv', '.DS_Store', '.mypy_cache']
+EXCLUDE = frozenset(['.git', 'node_modules', '__pycache__', 'venv', '.DS_Store', '.mypy_cache'])
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5 MB
+INLINE_CONTENT_LIMIT = 1024 * 1024  # tree API accepts inline content up to ~1 MB
+STREAM_THRESHOLD = 512 * 1024  # above this, base64-encode in chunks
+ENCODE_CHUNK = 48 * 1024  # multiple of 3: chunk boundaries stay padding-free
+# Only the progress icon depends on the file kind; an extension probe is
+# enough and skips loading the mimetypes database.
+IMAGE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.ico', '.bmp'})
+
+def _excluded(name: str) -> bool:
+    # Innermost-loop predicate: cheap prefix test first, then an O(1)
+    # frozenset probe instead of a linear list scan.
+    return name.startswith('.') or name in EXCLUDE
 
 class GitHubManager:
     def __init__(self, token, username):
@@ -48,116 +64,243 @@ class GitHubManager:
                 console.print(f"[red]Error creating repository: {e}[/red]")
                 return None
 
+    def _iter_files(self, root: Path, base: Path):
+        """Yield (path, rel_path) for every uploadable file under `root`.
+
+        scandir's DirEntry carries the stat from the directory read, so
+        the size check costs no extra syscall per file, unlike the
+        os.walk + Path.stat pairing this replaces.
+
+        Symlinks get the os.walk treatment: links to files are followed
+        and uploaded as their target's content, links to directories are
+        not descended into (no recursion loops).
+        """
+        with os.scandir(root) as it:
+            for entry in it:
+                if _excluded(entry.name):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._iter_files(Path(entry.path), base)
+                elif entry.is_file():
+                    file_path = Path(entry.path)
+                    rel_path = file_path.relative_to(base)
+                    if entry.stat().st_size > MAX_FILE_SIZE:
+                        console.print(f"[yellow]Skipping large file: {rel_path}[/yellow]")
+                        continue
+                    yield file_path, str(rel_path)
+
     def _upload_files(self, repo, project_path: Path, readme_path: Path, branch: str = 'main'):
         # Gather all files to upload
         files_to_upload = []
-        for root, dirs, files in os.walk(project_path):
-            dirs[:] = [d for d in dirs if d not in EXCLUDE_PATTERNS and not d.startswith('.')]
-            for file in files:
-                if file.startswith('.') or file in EXCLUDE_PATTERNS:
-                    continue
-                file_path = Path(root) / file
-                rel_path = file_path.relative_to(project_path)
-                if file_path == readme_path:
-                    rel_path = 'README.md'
-                if file_path.stat().st_size > MAX_FILE_SIZE:
-                    console.print(f"[yellow]Skipping large file: {rel_path}[/yellow]")
-                    continue
-                files_to_upload.append((file_path, str(rel_path)))
+        for file_path, rel_path in self._iter_files(project_path, project_path):
+            if file_path == readme_path:
+                rel_path = 'README.md'
+            files_to_upload.append((file_path, rel_path))
 
-        # Ensure branch exists
+        # One GraphQL round-trip replaces the ref -> commit -> recursive
+        # tree REST chain (three sequential RTTs) when the branch already
+        # exists; missing branches and empty repositories fall back to
+        # the REST path below.
+        existing = None
         try:
-            ref = repo.get_git_ref(f'heads/{branch}')
-            latest_commit = repo.get_git_commit(ref.object.sha)
-            base_tree = repo.get_git_tree(latest_commit.tree.sha)
-        except Exception as e:
-            # Handle empty repository (409 error)
-            if hasattr(e, 'status') and e.status == 409 or 'Git Repository is empty' in str(e):
-                # Find the README file to use as the first commit
-                readme_tuple = next(((fp, rp) for fp, rp in files_to_upload if str(rp).lower() == 'readme.md'), None)
-                if not readme_tuple:
-                    console.print("[red]Cannot initialize empty repository: README.md not found in project.[/red]")
-                    return
-                file_path, rel_path = readme_tuple
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                    repo.create_file(rel_path, f"Initial commit: {rel_path}", content.decode('utf-8'), branch=branch)
-                    console.print(f"[green]Initialized repository with {rel_path} on branch {branch}.[/green]")
-                # Remove README from upload list (already uploaded)
-                files_to_upload = [t for t in files_to_upload if t != readme_tuple]
-                # Now the branch exists, re-fetch refs
+            owner, name = repo.full_name.split('/', 1)
+            state = fetch_branch_state(self.token, owner, name, branch)
+            if state is not None:
+                existing = state.blobs
+        except Exception:
+            existing = None
+
+        if existing is None:
+            # Ensure branch exists
+            try:
                 ref = repo.get_git_ref(f'heads/{branch}')
                 latest_commit = repo.get_git_commit(ref.object.sha)
-                base_tree = repo.get_git_tree(latest_commit.tree.sha)
-            else:
-                # Branch does not exist, create it from main or default branch
-                try:
-                    master_ref = repo.get_git_ref('heads/main')
-                except Exception:
-                    master_ref = repo.get_git_ref(f'heads/{repo.default_branch}')
-                ref = repo.create_git_ref(ref=f'refs/heads/{branch}', sha=master_ref.object.sha)
-                latest_commit = repo.get_git_commit(master_ref.object.sha)
-                base_tree = repo.get_git_tree(latest_commit.tree.sha)
+                base_tree = repo.get_git_tree(latest_commit.tree.sha, recursive=True)
+            except Exception as e:
+                # Handle empty repository (409 error)
+                if hasattr(e, 'status') and e.status == 409 or 'Git Repository is empty' in str(e):
+                    # Find the README file to use as the first commit
+                    readme_tuple = next(((fp, rp) for fp, rp in files_to_upload if str(rp).lower() == 'readme.md'), None)
+                    if not readme_tuple:
+                        console.print("[red]Cannot initialize empty repository: README.md not found in project.[/red]")
+                        return
+                    file_path, rel_path = readme_tuple
+                    content = file_path.read_bytes()
+                    repo.create_file(rel_path, f"Initial commit: {rel_path}", content.decode('utf-8'), branch=branch)
+                    console.print(f"[green]Initialized repository with {rel_path} on branch {branch}.[/green]")
+                    # Remove README from upload list (already uploaded)
+                    files_to_upload = [t for t in files_to_upload if t != readme_tuple]
+                    # Now the branch exists, re-fetch refs
+                    ref = repo.get_git_ref(f'heads/{branch}')
+                    latest_commit = repo.get_git_commit(ref.object.sha)
+                    base_tree = repo.get_git_tree(latest_commit.tree.sha, recursive=True)
+                else:
+                    # Branch does not exist, create it from main or default branch
+                    try:
+                        master_ref = repo.get_git_ref('heads/main')
+                    except Exception:
+                        master_ref = repo.get_git_ref(f'heads/{repo.default_branch}')
+                    ref = repo.create_git_ref(ref=f'refs/heads/{branch}', sha=master_ref.object.sha)
+                    latest_commit = repo.get_git_commit(master_ref.object.sha)
+                    base_tree = repo.get_git_tree(latest_commit.tree.sha, recursive=True)
+
+            # One recursive tree read yields {path: sha} for the whole branch,
+            # replacing what would otherwise be a per-file existence probe.
+            existing = {el.path: el.sha for el in base_tree.tree if el.type == 'blob'}
 
         tree_elements = []
         with Progress(SpinnerColumn(), BarColumn(), TextColumn("{task.description}"), console=console) as progress:
             upload_task = progress.add_task("[cyan]Uploading files...", total=len(files_to_upload))
-            for file_path, rel_path in files_to_upload:
-                while True:
-                    try:
-                        with open(file_path, 'rb') as f:
-                            content = f.read()
-                            mime, _ = mimetypes.guess_type(file_path)
-                            is_bin = is_binary(content)
-                            icon = "📄" if not is_bin else ("🖼️" if mime and mime.startswith('image') else "💾")
-                            if is_bin:
-                                # Prepare binary file for commit as blob
-                                blob = repo.create_git_blob(base64.b64encode(content).decode('utf-8'), 'base64')
-                                tree_elements.append(InputGitTreeElement(rel_path, '100644', 'blob', sha=blob.sha))
-                                progress.console.print(f"{icon} [cyan]Prepared binary file for upload:[/cyan] {rel_path}")
-                            else:
-                                # Text file: check if it exists, then create or update
-                                try:
-                                    contents = repo.get_contents(rel_path, ref=branch)
-                                    # File exists, update
-                                    repo.update_file(rel_path, f"Update {rel_path}", content.decode('utf-8'), contents.sha, branch=branch)
-                                    progress.console.print(f"{icon} [yellow]Updated text file:[/yellow] {rel_path}")
-                                except Exception as e:
-                                    if '404' in str(e) or 'Not Found' in str(e):
-                                        # File does not exist, create
-                                        repo.create_file(rel_path, f"Add {rel_path}", content.decode('utf-8'), branch=branch)
-                                        progress.console.print(f"{icon} [green]Uploaded text file:[/green] {rel_path}")
-                                    else:
-                                        raise e
-                        break
-                    except Exception as e:
-                        progress.console.print(f"[red]Error uploading {rel_path}: {e}[/red]")
-                        action = None
-                        while action not in ["r", "s", "a"]:
-                            action = Prompt.ask(f"[red]Retry (r), Skip (s), or Abort (a)?[/red]", choices=["r", "s", "a"], default="s")
-                        if action == "r":
+            pending = list(files_to_upload)
+            while pending:
+                failures = []
+                # Uploads are network-bound, so a pool of workers overlaps
+                # the per-file round-trips; Rich writes stay on the main
+                # thread, which consumes results as they complete.
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    futures = {
+                        executor.submit(self._upload_with_retries, repo, file_path, rel_path, branch, existing.get(rel_path)): (file_path, rel_path)
+                        for file_path, rel_path in pending
+                    }
+                    for future in as_completed(futures):
+                        file_path, rel_path = futures[future]
+                        try:
+                            element, icon, kind = future.result()
+                        except Exception as e:
+                            failures.append((file_path, rel_path, e))
+                            continue
+                        if element is None:
+                            progress.console.print(f"{icon} [dim]unchanged[/dim]: {rel_path}")
+                            progress.advance(upload_task)
                             continue
-                        elif action == "s":
-                            break
-                        elif action == "a":
-                            progress.console.print("[red]Aborted upload process by user.[/red]")
-                            return
-                    finally:
+                        tree_elements.append(element)
+                        verb = "Updated" if rel_path in existing else "Added"
+                        label = f"[cyan]{verb} binary file[/cyan]" if kind == "binary" else f"[green]{verb} text file[/green]"
+                        progress.console.print(f"{icon} {label}: {rel_path}")
                         progress.advance(upload_task)
-        # Commit binary files if any
+                pending = []
+                if failures:
+                    table = Table(title=f"{len(failures)} file(s) failed after 3 attempts", show_lines=False)
+                    table.add_column("File", style="cyan")
+                    table.add_column("Error", style="red")
+                    for _, rel_path, error in failures:
+                        table.add_row(rel_path, str(error))
+                    progress.console.print(table)
+                    action = None
+                    while action not in ["r", "s", "a"]:
+                        action = Prompt.ask("[red]Retry all (r), Skip all (s), or Abort (a)?[/red]", choices=["r", "s", "a"], default="s")
+                    if action == "r":
+                        pending = [(fp, rp) for fp, rp, _ in failures]
+                    elif action == "s":
+                        progress.advance(upload_task, len(failures))
+                    else:
+                        progress.console.print("[red]Aborted upload process by user.[/red]")
+                        return
+        # One atomic tree commit covers every file: N contents-API calls
+        # collapse into create_git_tree + create_git_commit + ref.edit.
         if tree_elements:
             try:
-                # Re-fetch latest commit/tree for branch after text file updates
                 ref = repo.get_git_ref(f'heads/{branch}')
                 latest_commit = repo.get_git_commit(ref.object.sha)
                 base_tree = repo.get_git_tree(latest_commit.tree.sha)
                 new_tree = repo.create_git_tree(tree_elements, base_tree)
-                commit_message = "Add/update binary files"
+                commit_message = "Deploy project files"
                 new_commit = repo.create_git_commit(commit_message, new_tree, [latest_commit])
                 ref.edit(new_commit.sha)
-                console.print(f"[green]Committed binary files to branch {branch}.[/green]")
+                console.print(f"[green]Committed {len(tree_elements)} file(s) to branch {branch}.[/green]")
             except Exception as e:
-                console.print(f"[red]Error committing binary files: {e}[/red]")
+                console.print(f"[red]Error committing files: {e}[/red]")
+
+    def _upload_with_retries(self, repo, file_path: Path, rel_path: str, branch: str, base_sha=None):
+        """Run _upload_one with up to 3 attempts and exponential backoff.
+
+        Transient GitHub errors (rate limits, dropped connections)
+        usually clear within a couple of seconds, so retrying on the
+        worker lets most deploys finish in one pass; only files that
+        fail all attempts reach the consolidated prompt.
+        """
+        for attempt in range(3):
+            try:
+                return self._upload_one(repo, file_path, rel_path, branch, base_sha)
+            except Exception:
+                if attempt == 2:
+                    raise
+                time.sleep(2 ** attempt)
+
+    def _upload_one(self, repo, file_path: Path, rel_path: str, branch: str, base_sha=None):
+        """Prepare one file as a git tree element; runs on a worker thread.
+
+        Returns (None, icon, "unchanged") when the file's git blob sha
+        matches the base tree — git's blob ids are computable locally,
+        so identical content never leaves the machine. Text files under
+        the inline limit ride directly on the tree element, so the tree
+        API hashes and stores them server-side with no per-file RPC at
+        all; binaries and oversized text still go through
+        create_git_blob.
+        """
+        size = file_path.stat().st_size
+        encoded = None
+        if size > STREAM_THRESHOLD:
+            with open(file_path, 'rb') as f:
+                # The first 8 KB is enough to classify a file (git's own
+                # heuristic); no need to scan multi-MB buffers.
+                head = f.read(8192)
+                is_bin = is_binary(head)
+                if is_bin or size > INLINE_CONTENT_LIMIT:
+                    f.seek(0)
+                    encoded, git_sha = self._encode_chunked(f, size)
+                else:
+                    content = head + f.read()
+        else:
+            # Single C-level read: Path.read_bytes skips the Python-side
+            # context-manager frames on the per-file hot path.
+            content = file_path.read_bytes()
+            is_bin = is_binary(content[:8192])
+        icon = "\U0001F4C4" if not is_bin else ("\U0001F5BC\uFE0F" if file_path.suffix.lower() in IMAGE_EXTS else "\U0001F4BE")
+        if encoded is None:
+            git_sha = hashlib.sha1(b"blob " + str(len(content)).encode() + b"\0" + content).hexdigest()
+        if base_sha is not None and git_sha == base_sha:
+            return (None, icon, "unchanged")
+        if encoded is None and not is_bin and len(content) <= INLINE_CONTENT_LIMIT:
+            # Strict decode: non-UTF-8 text (latin-1, say) passes the
+            # binary heuristic, and a lossy decode would deploy every
+            # high byte as U+FFFD — and since GitHub then stores the
+            # mangled bytes, the local blob sha never matches again and
+            # the file re-uploads as "changed" on every deploy. Undecodable
+            # files fall through to the base64 blob path, which is exact.
+            try:
+                text = content.decode('utf-8')
+            except UnicodeDecodeError:
+                pass
+            else:
+                return (InputGitTreeElement(rel_path, '100644', 'blob', content=text), icon, "text")
+        # b2a_base64 skips the line-wrapping layer, and ascii decode of pure
+        # base64 is cheaper than utf-8; content stays worker-local so at most
+        # max_workers file buffers are resident at once.
+        if encoded is None:
+            encoded = binascii.b2a_base64(content, newline=False).decode('ascii')
+        blob = repo.create_git_blob(encoded, 'base64')
+        return (InputGitTreeElement(rel_path, '100644', 'blob', sha=blob.sha), icon, "binary")
+
+    @staticmethod
+    def _encode_chunked(f, size: int):
+        """Base64-encode an open file in 48 KB chunks.
+
+        48 KB is a multiple of 3, so each chunk encodes without padding
+        and the pieces concatenate into valid base64. Only one raw chunk
+        is resident per worker instead of the whole file plus its ~1.33x
+        encoding; the blob sha is accumulated on the same pass so the
+        unchanged-file check costs no extra read.
+        """
+        sha = hashlib.sha1(b"blob " + str(size).encode() + b"\0")
+        buf = io.BytesIO()
+        while True:
+            chunk = f.read(ENCODE_CHUNK)
+            if not chunk:
+                break
+            sha.update(chunk)
+            buf.write(binascii.b2a_base64(chunk, newline=False))
+        return buf.getvalue().decode('ascii'), sha.hexdigest()
 
 def deploy_to_github():
     print("Project deployed to GitHub (placeholder).") 
\ No newline at end of file
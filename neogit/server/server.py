@@ -1,36 +1,67 @@
 """Configuration management for GitHub README MCP Server."""
 
+import functools
+import json
 import os
-import yaml
-import subprocess
-import shutil
+import sys
+import tempfile
 from pathlib import Path
 from typing import Dict, Optional, Any, List
 from dataclasses import dataclass
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-import requests
 from neogit.utils.prompt_utils import ascii_banner, select_menu, confirm_menu, text_input
 
+# Slotted instances skip the per-instance __dict__: smaller and with
+# C-level slot reads on the per-request config lookups. slots= only
+# exists on 3.10+, so older interpreters fall back to plain dataclasses.
+if sys.version_info >= (3, 10):
+    _config_dataclass = functools.partial(dataclass, slots=True)
+else:
+    _config_dataclass = dataclass
+
+
+def _yaml_codec():
+    """Import yaml on demand.
+
+    With the JSON sidecar and in-process caches, most invocations never
+    parse YAML at all, so the import (and libyaml probe) stays off the
+    startup path. Prefers the C bindings, which parse/emit several
+    times faster than the pure-Python scanner.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+    return yaml, SafeLoader, SafeDumper
+
 console = Console()
 
+# Static menu/status panels built once: Rich markup parsing happens at
+# import, printing them is parse-free.
+_MENU_PANEL = Panel.fit(Text.from_markup("[bold blue]MCP Configuration Menu[/bold blue]"), border_style="blue")
+_SAVED_PANEL = Panel.fit(Text.from_markup("[bold green]✅ Configuration saved![/bold green]"), border_style="green")
+_CANCEL_PANEL = Panel.fit(Text.from_markup("[bold yellow]Exited without saving changes.[/bold yellow]"), border_style="yellow")
+_PROVIDERS_PANEL = Panel.fit(Text.from_markup("[bold magenta]AI Providers Menu[/bold magenta]"), border_style="magenta")
+
 
-@dataclass
+@_config_dataclass
 class GitHubConfig:
     """GitHub configuration settings."""
     username: str
     token: str
 
 
-@dataclass
+@_config_dataclass
 class HuggingFaceConfig:
     api_key: str
     models: list  # keep as list for compatibility, but only one model will be stored
     default_model: str
 
 
-@dataclass
+@_config_dataclass
 class AIProvidersConfig:
     openai: Optional[Dict[str, str]] = None
     anthropic: Optional[Dict[str, str]] = None
@@ -39,7 +70,7 @@ class AIProvidersConfig:
     ollama: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@_config_dataclass
 class AppConfig:
     """Application configuration."""
     github: GitHubConfig
@@ -47,13 +78,43 @@ class AppConfig:
     ai_providers: Optional[AIProvidersConfig] = None
 
 
+# Baseline provider mapping for serialization: copied and overlaid in
+# save_config so only configured providers are rebuilt per save.
+_EMPTY_AIPROVIDERS_TEMPLATE = {
+    'openai': None,
+    'anthropic': None,
+    'google': None,
+    'huggingface': None,
+    'ollama': None,
+}
+
+
 class ConfigManager:
     """Manages application configuration and setup."""
-    
+
+    # Parsed configs keyed by path -> (mtime, size, AppConfig). Shared
+    # across instances so repeat loads are a stat plus a dict probe;
+    # entries are invalidated by the key whenever the file changes on
+    # disk. Cached AppConfigs are handed out as-is, not copied.
+    _cache: Dict[Path, tuple] = {}
+
     def __init__(self):
         self.config_dir = Path.home() / ".github-readme-mcp"
         self.config_file = self.config_dir / "config.yaml"
         self.config: Optional[AppConfig] = None
+        self._http = None
+
+    def _session(self):
+        """Pooled HTTP session, created on first provider test.
+
+        Keep-alive reuses one TCP+TLS connection across the test calls
+        instead of paying a fresh handshake per request; lazy so plain
+        config reads never import requests.
+        """
+        if self._http is None:
+            import requests
+            self._http = requests.Session()
+        return self._http
         
     def setup(self) -> AppConfig:
         """Menu-driven interactive setup for configuration."""
@@ -67,7 +128,7 @@ class ConfigManager:
         while True:
             # Show current config summary
             self._print_config_summary(config)
-            console.print(Panel.fit("[bold blue]MCP Configuration Menu[/bold blue]", border_style="blue"))
+            console.print(_MENU_PANEL)
             choice = select_menu(
                 "What would you like to do?",
                 [
@@ -87,12 +148,23 @@ class ConfigManager:
             elif choice == "Save & Exit":
                 self.save_config(config)
                 self.config = config
-                console.print(Panel.fit("[bold green]✅ Configuration saved![/bold green]", border_style="green"))
+                console.print(_SAVED_PANEL)
                 return config
             elif choice == "Cancel/Exit without saving":
-                console.print(Panel.fit("[bold yellow]Exited without saving changes.[/bold yellow]", border_style="yellow"))
+                console.print(_CANCEL_PANEL)
                 return current
 
+    # Static accessor table for the summary: direct attribute loads
+    # instead of getattr-by-name on every menu redraw, and falsy
+    # providers skip string construction entirely.
+    _PROVIDER_GETTERS = (
+        ("openai", lambda a: a.openai),
+        ("anthropic", lambda a: a.anthropic),
+        ("google", lambda a: a.google),
+        ("huggingface", lambda a: a.huggingface),
+        ("ollama", lambda a: a.ollama),
+    )
+
     def _print_config_summary(self, config: AppConfig):
         from rich.table import Table
         table = Table(title="Current [bold magenta]NeoGit[/bold magenta] Configuration", show_header=True, header_style="bold magenta")
@@ -102,24 +174,30 @@ class ConfigManager:
         table.add_row("Alias", f"[magenta]{config.alias}[/magenta]" if config.alias else "[dim]Not set[/dim]")
         provs = []
         aip = config.ai_providers
-        for prov in ["openai", "anthropic", "google", "huggingface", "ollama"]:
-            val = getattr(aip, prov, None) if aip else None
-            if prov == "huggingface" and val:
-                provs.append(f"[green]{prov}[/green] (model: [yellow]{val.default_model}[/yellow], key: {'set' if val.api_key else 'not set'})")
-            elif val:
-                provs.append(f"[green]{prov}[/green] (key: {'set' if val.get('api_key') else 'not set'})")
+        if aip:
+            for prov, get in self._PROVIDER_GETTERS:
+                val = get(aip)
+                if not val:
+                    continue
+                if prov == "huggingface":
+                    provs.append(f"[green]{prov}[/green] (model: [yellow]{val.default_model}[/yellow], key: {'set' if val.api_key else 'not set'})")
+                else:
+                    provs.append(f"[green]{prov}[/green] (key: {'set' if val.get('api_key') else 'not set'})")
         table.add_row("AI Providers", ", ".join(provs) if provs else "[dim]None configured[/dim]")
         console.print(table)
 
     def _edit_github(self, github: GitHubConfig) -> GitHubConfig:
-        username = text_input("GitHub username", default=github.username or "")
-        token = text_input("GitHub access token", password=True, default=github.token or "")
-        skip_validation = confirm_menu("Skip GitHub credential validation?", default=False)
-        if not skip_validation:
-            if not self._validate_github_credentials(username, token):
-                console.print("[red]Invalid GitHub credentials. Please check your username and token.[/red]")
-                return self._edit_github(github)
-        return GitHubConfig(username=username, token=token)
+        # Iterative retry: re-prompting on bad credentials should not
+        # grow the call stack one frame per attempt.
+        while True:
+            username = text_input("GitHub username", default=github.username or "")
+            token = text_input("GitHub access token", password=True, default=github.token or "")
+            skip_validation = confirm_menu("Skip GitHub credential validation?", default=False)
+            if not skip_validation:
+                if not self._validate_github_credentials(username, token):
+                    console.print("[red]Invalid GitHub credentials. Please check your username and token.[/red]")
+                    continue
+            return GitHubConfig(username=username, token=token)
 
     def _edit_alias(self, alias: Optional[str]) -> Optional[str]:
         create_alias = confirm_menu("Would you like to set or change the alias?", default=bool(alias))
@@ -129,42 +207,42 @@ class ConfigManager:
             return alias_val
         return None
 
+    @staticmethod
+    def _provider_label(ai_providers: AIProvidersConfig, prov: str) -> str:
+        val = getattr(ai_providers, prov, None)
+        if prov == "huggingface" and val:
+            return f"{prov} (models: {', '.join(val.models)}, default: {val.default_model})"
+        if val:
+            return f"{prov} (configured)"
+        return f"{prov} [not configured]"
+
     def _edit_ai_providers(self, ai_providers: Optional[AIProvidersConfig]) -> AIProvidersConfig:
         if not ai_providers:
             ai_providers = AIProvidersConfig()
+        provider_keys = ["openai", "anthropic", "google", "huggingface", "ollama"]
+        # Labels are kept as an incremental view: built once, and only
+        # the provider touched in an iteration is re-rendered, instead
+        # of recomputing all five on every menu redraw.
+        labels = {prov: self._provider_label(ai_providers, prov) for prov in provider_keys}
         while True:
             # Show current providers
-            console.print(Panel.fit("[bold magenta]AI Providers Menu[/bold magenta]", border_style="magenta"))
-            provider_labels = []
-            provider_keys = ["openai", "anthropic", "google", "huggingface", "ollama"]
-            for prov in provider_keys:
-                val = getattr(ai_providers, prov, None)
-                if prov == "huggingface" and val:
-                    provider_labels.append(f"{prov} (models: {', '.join(val.models)}, default: {val.default_model})")
-                elif val:
-                    provider_labels.append(f"{prov} (configured)")
-                else:
-                    provider_labels.append(f"{prov} [not configured]")
-            menu_choices = provider_labels + ["Add Provider", "Remove Provider", "Back to Main Menu"]
+            console.print(_PROVIDERS_PANEL)
+            menu_choices = list(labels.values()) + ["Add Provider", "Remove Provider", "Back to Main Menu"]
             choice = select_menu("Select an option", choices=menu_choices)
-            if choice.startswith("openai"):
-                ai_providers = self._edit_provider(ai_providers, "openai")
-            elif choice.startswith("anthropic"):
-                ai_providers = self._edit_provider(ai_providers, "anthropic")
-            elif choice.startswith("google"):
-                ai_providers = self._edit_provider(ai_providers, "google")
-            elif choice.startswith("huggingface"):
-                ai_providers = self._edit_provider(ai_providers, "huggingface")
-            elif choice.startswith("ollama"):
-                ai_providers = self._edit_provider(ai_providers, "ollama")
-            elif choice == "Add Provider":
+            if choice == "Add Provider":
                 prov = select_menu("Which provider to add?", choices=provider_keys)
                 ai_providers = self._edit_provider(ai_providers, prov)
+                labels[prov] = self._provider_label(ai_providers, prov)
             elif choice == "Remove Provider":
                 prov = select_menu("Which provider to remove?", choices=provider_keys)
                 setattr(ai_providers, prov, None)
+                labels[prov] = self._provider_label(ai_providers, prov)
             elif choice == "Back to Main Menu":
                 break
+            else:
+                prov = choice.split(" ", 1)[0]
+                ai_providers = self._edit_provider(ai_providers, prov)
+                labels[prov] = self._provider_label(ai_providers, prov)
         return ai_providers
 
     def _edit_provider(self, ai_providers: AIProvidersConfig, prov: str) -> AIProvidersConfig:
@@ -176,132 +254,176 @@ class ConfigManager:
                 console.print(f"[yellow]{label}: {'*' * len(value)}[/yellow]")
             return confirm_menu(f"Is this {label} correct?", default=True)
 
-        if prov == "openai":
-            key = text_input("OpenAI API key", password=True)
-            if not confirm_credential("OpenAI API key", key):
-                return self._edit_provider(ai_providers, prov)
-            if confirm_menu("Test OpenAI connection?", default=True):
-                try:
-                    import openai
-                    client = openai.OpenAI(api_key=key)
-                    client.models.list()
-                    console.print("[green]OpenAI connection successful![/green]")
-                except Exception as e:
-                    console.print(f"[red]OpenAI connection failed: {e}[/red]")
-                    if not confirm_menu("Continue anyway?", default=False):
-                        return self._edit_provider(ai_providers, prov)
-            ai_providers.openai = {"api_key": key}
-        elif prov == "anthropic":
-            key = text_input("Anthropic API key", password=True)
-            if not confirm_credential("Anthropic API key", key):
-                return self._edit_provider(ai_providers, prov)
-            if confirm_menu("Test Anthropic connection?", default=True):
-                try:
-                    import anthropic
-                    client = anthropic.Anthropic(api_key=key)
-                    client.models.list()
-                    console.print("[green]Anthropic connection successful![/green]")
-                except Exception as e:
-                    console.print(f"[red]Anthropic connection failed: {e}[/red]")
-                    if not confirm_menu("Continue anyway?", default=False):
-                        return self._edit_provider(ai_providers, prov)
-            ai_providers.anthropic = {"api_key": key}
-        elif prov == "google":
-            key = text_input("Google Gemini API key", password=True)
-            if not confirm_credential("Google Gemini API key", key):
-                return self._edit_provider(ai_providers, prov)
-            # Prompt for model name
-            model = text_input("Google Gemini model name (see API docs or use 'models/gemini-1.5-pro-latest')", default="models/gemini-1.5-pro-latest")
-            if confirm_menu("Test Google Gemini connection?", default=True):
-                try:
-                    import google.generativeai as genai
-                    genai.configure(api_key=key)
-                    # Try to list models or access the selected model
-                    resp = requests.get(f"https://generativelanguage.googleapis.com/v1beta/{model}", params={"key": key})
-                    if resp.status_code == 200:
-                        console.print("[green]Google Gemini connection successful![/green]")
-                    else:
-                        console.print(f"[red]Google Gemini model may be invalid or not accessible. Status: {resp.status_code}")
+        # Single loop instead of recursive re-entry: each retry reuses
+        # the same frame and `continue` restarts the prompt sequence.
+        while True:
+            if prov == "openai":
+                key = text_input("OpenAI API key", password=True)
+                if not confirm_credential("OpenAI API key", key):
+                    continue
+                if confirm_menu("Test OpenAI connection?", default=True):
+                    try:
+                        import openai
+                        client = openai.OpenAI(api_key=key)
+                        client.models.list()
+                        console.print("[green]OpenAI connection successful![/green]")
+                    except Exception as e:
+                        console.print(f"[red]OpenAI connection failed: {e}[/red]")
+                        if not confirm_menu("Continue anyway?", default=False):
+                            continue
+                ai_providers.openai = {"api_key": key}
+            elif prov == "anthropic":
+                key = text_input("Anthropic API key", password=True)
+                if not confirm_credential("Anthropic API key", key):
+                    continue
+                if confirm_menu("Test Anthropic connection?", default=True):
+                    try:
+                        import anthropic
+                        client = anthropic.Anthropic(api_key=key)
+                        client.models.list()
+                        console.print("[green]Anthropic connection successful![/green]")
+                    except Exception as e:
+                        console.print(f"[red]Anthropic connection failed: {e}[/red]")
+                        if not confirm_menu("Continue anyway?", default=False):
+                            continue
+                ai_providers.anthropic = {"api_key": key}
+            elif prov == "google":
+                key = text_input("Google Gemini API key", password=True)
+                if not confirm_credential("Google Gemini API key", key):
+                    continue
+                # Prompt for model name
+                model = text_input("Google Gemini model name (see API docs or use 'models/gemini-1.5-pro-latest')", default="models/gemini-1.5-pro-latest")
+                if confirm_menu("Test Google Gemini connection?", default=True):
+                    try:
+                        import google.generativeai as genai
+                        genai.configure(api_key=key)
+                        # Try to list models or access the selected model
+                        resp = self._session().get(f"https://generativelanguage.googleapis.com/v1beta/{model}", params={"key": key})
+                        if resp.status_code == 200:
+                            console.print("[green]Google Gemini connection successful![/green]")
+                        else:
+                            console.print(f"[red]Google Gemini model may be invalid or not accessible. Status: {resp.status_code}")
+                            if not confirm_menu("Continue anyway?", default=False):
+                                continue
+                    except Exception as e:
+                        console.print(f"[red]Google Gemini connection failed: {e}[/red]")
                         if not confirm_menu("Continue anyway?", default=False):
-                            return self._edit_provider(ai_providers, prov)
-                except Exception as e:
-                    console.print(f"[red]Google Gemini connection failed: {e}[/red]")
-                    if not confirm_menu("Continue anyway?", default=False):
-                        return self._edit_provider(ai_providers, prov)
-            ai_providers.google = {"api_key": key, "model": model}
-        elif prov == "huggingface":
-            key = text_input("Hugging Face API key", password=True)
-            if not confirm_credential("Hugging Face API key", key):
-                return self._edit_provider(ai_providers, prov)
-            # Prompt for model name with retry logic
-            while True:
-                model = text_input("Hugging Face model name (e.g. 'mistralai/Mistral-7B-Instruct-v0.2')", default="mistralai/Mistral-7B-Instruct-v0.2")
-                # Fetch model info
-                model_info = None
-                try:
-                    resp = requests.get(f"https://huggingface.co/api/models/{model}")
-                    if resp.status_code == 200:
-                        model_info = resp.json()
-                        desc = model_info.get('cardData', {}).get('summary', '') or model_info.get('pipeline_tag', '')
-                        license = model_info.get('license', 'unknown')
-                        console.print(f"[green]Model found:[/green] [bold]{model}[/bold] | [cyan]{desc}[/cyan] | License: [magenta]{license}[/magenta]")
-                        break  # Valid model, exit loop
-                    else:
-                        console.print(f"[red]Model '{model}' not found on Hugging Face Hub.[/red]")
+                            continue
+                ai_providers.google = {"api_key": key, "model": model}
+            elif prov == "huggingface":
+                key = text_input("Hugging Face API key", password=True)
+                if not confirm_credential("Hugging Face API key", key):
+                    continue
+                # Prompt for model name with retry logic
+                whoami_resp = None
+                while True:
+                    model = text_input("Hugging Face model name (e.g. 'mistralai/Mistral-7B-Instruct-v0.2')", default="mistralai/Mistral-7B-Instruct-v0.2")
+                    # Fetch model info; the whoami check rides along on a second
+                    # worker so the later connection test is usually already
+                    # answered by the time the user reaches it.
+                    model_info = None
+                    try:
+                        from concurrent.futures import ThreadPoolExecutor
+                        session = self._session()
+                        with ThreadPoolExecutor(max_workers=2) as pool:
+                            model_fut = pool.submit(session.get, f"https://huggingface.co/api/models/{model}", timeout=10)
+                            whoami_fut = None
+                            if whoami_resp is None:
+                                whoami_fut = pool.submit(session.get, "https://huggingface.co/api/whoami-v2", headers={"Authorization": f"Bearer {key}"}, timeout=10)
+                            resp = model_fut.result()
+                            if whoami_fut is not None:
+                                try:
+                                    whoami_resp = whoami_fut.result()
+                                except Exception:
+                                    whoami_resp = None
+                        if resp.status_code == 200:
+                            model_info = resp.json()
+                            desc = model_info.get('cardData', {}).get('summary', '') or model_info.get('pipeline_tag', '')
+                            license = model_info.get('license', 'unknown')
+                            console.print(f"[green]Model found:[/green] [bold]{model}[/bold] | [cyan]{desc}[/cyan] | License: [magenta]{license}[/magenta]")
+                            break  # Valid model, exit loop
+                        else:
+                            console.print(f"[red]Model '{model}' not found on Hugging Face Hub.[/red]")
+                            if not confirm_menu("Try another model name?", default=True):
+                                model = None
+                                break
+                    except Exception as e:
+                        console.print(f"[red]Error fetching model info: {e}[/red]")
                         if not confirm_menu("Try another model name?", default=True):
-                            return self._edit_provider(ai_providers, prov)
-                except Exception as e:
-                    console.print(f"[red]Error fetching model info: {e}[/red]")
-                    if not confirm_menu("Try another model name?", default=True):
-                        return self._edit_provider(ai_providers, prov)
-            # Test connection
-            if confirm_menu("Test Hugging Face connection?", default=True):
-                try:
-                    headers = {"Authorization": f"Bearer {key}"}
-                    test_resp = requests.get("https://huggingface.co/api/whoami-v2", headers=headers)
-                    if test_resp.status_code == 200:
-                        console.print("[green]Hugging Face API key is valid![/green]")
-                    else:
-                        console.print(f"[red]Hugging Face API key may be invalid or rate-limited. Status: {test_resp.status_code}[/red]")
+                            model = None
+                            break
+                if model is None:
+                    continue
+                # Test connection
+                if confirm_menu("Test Hugging Face connection?", default=True):
+                    try:
+                        test_resp = whoami_resp
+                        if test_resp is None:
+                            headers = {"Authorization": f"Bearer {key}"}
+                            test_resp = self._session().get("https://huggingface.co/api/whoami-v2", headers=headers, timeout=10)
+                        if test_resp.status_code == 200:
+                            console.print("[green]Hugging Face API key is valid![/green]")
+                        else:
+                            console.print(f"[red]Hugging Face API key may be invalid or rate-limited. Status: {test_resp.status_code}[/red]")
+                            if not confirm_menu("Continue anyway?", default=False):
+                                continue
+                    except Exception as e:
+                        console.print(f"[red]Hugging Face connection failed: {e}[/red]")
                         if not confirm_menu("Continue anyway?", default=False):
-                            return self._edit_provider(ai_providers, prov)
-                except Exception as e:
-                    console.print(f"[red]Hugging Face connection failed: {e}[/red]")
-                    if not confirm_menu("Continue anyway?", default=False):
-                        return self._edit_provider(ai_providers, prov)
-            ai_providers.huggingface = HuggingFaceConfig(api_key=key, models=[model], default_model=model)
-        elif prov == "ollama":
-            endpoint = text_input("Ollama endpoint", default="http://localhost:11434")
-            if not confirm_credential("Ollama endpoint", endpoint):
-                return self._edit_provider(ai_providers, prov)
-            if confirm_menu("Test Ollama connection?", default=True):
-                try:
-                    resp = requests.get(f"{endpoint}/api/tags")
-                    if resp.status_code == 200:
-                        tags = resp.json().get('models', [])
-                        tag_list = ', '.join([t['name'] for t in tags]) if tags else 'No models found.'
-                        console.print(f"[green]Ollama connection successful! Models: {tag_list}[/green]")
-                    else:
-                        console.print(f"[red]Ollama endpoint error: {resp.status_code}[/red]")
+                            continue
+                ai_providers.huggingface = HuggingFaceConfig(api_key=key, models=[model], default_model=model)
+            elif prov == "ollama":
+                endpoint = text_input("Ollama endpoint", default="http://localhost:11434")
+                if not confirm_credential("Ollama endpoint", endpoint):
+                    continue
+                if confirm_menu("Test Ollama connection?", default=True):
+                    try:
+                        resp = self._session().get(f"{endpoint}/api/tags")
+                        if resp.status_code == 200:
+                            tags = resp.json().get('models', [])
+                            tag_list = ', '.join([t['name'] for t in tags]) if tags else 'No models found.'
+                            console.print(f"[green]Ollama connection successful! Models: {tag_list}[/green]")
+                        else:
+                            console.print(f"[red]Ollama endpoint error: {resp.status_code}[/red]")
+                            if not confirm_menu("Continue anyway?", default=False):
+                                continue
+                    except Exception as e:
+                        console.print(f"[red]Ollama connection failed: {e}[/red]")
                         if not confirm_menu("Continue anyway?", default=False):
-                            return self._edit_provider(ai_providers, prov)
-                except Exception as e:
-                    console.print(f"[red]Ollama connection failed: {e}[/red]")
-                    if not confirm_menu("Continue anyway?", default=False):
-                        return self._edit_provider(ai_providers, prov)
-            ai_providers.ollama = {"endpoint": endpoint}
-        return ai_providers
+                            continue
+                ai_providers.ollama = {"endpoint": endpoint}
+            return ai_providers
 
     def load_config(self) -> AppConfig:
         """Load configuration from file."""
         if self.config:
             return self.config
-        if not self.config_file.exists():
+        try:
+            st = self.config_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 "Configuration not found. Please run 'github-readme-mcp setup' first."
             )
-        with open(self.config_file, 'r') as f:
-            data = yaml.safe_load(f)
+        cached = ConfigManager._cache.get(self.config_file)
+        if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            self.config = cached[2]
+            return self.config
+        # A JSON sidecar written on every save parses an order of
+        # magnitude faster than YAML; trust it while it is at least as
+        # fresh as the YAML, otherwise parse the YAML and rewrite it.
+        cache_file = self.config_file.with_suffix('.yaml.cache.json')
+        data = None
+        try:
+            if cache_file.stat().st_mtime >= st.st_mtime:
+                with open(cache_file, 'r') as f:
+                    data = json.load(f)
+        except (OSError, ValueError):
+            data = None
+        if data is None:
+            yaml, SafeLoader, _ = _yaml_codec()
+            with open(self.config_file, 'r') as f:
+                data = yaml.load(f, Loader=SafeLoader)
+            self._write_sidecar(cache_file, data)
         github_config = GitHubConfig(
             username=data['github']['username'],
             token=data['github']['token']
@@ -323,41 +445,91 @@ class ConfigManager:
             alias=data.get('alias'),
             ai_providers=ai_providers
         )
+        ConfigManager._cache[self.config_file] = (st.st_mtime, st.st_size, self.config)
         return self.config
     
     def save_config(self, config: AppConfig) -> None:
         """Save configuration to file."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        # Serialize AI providers
+        # Serialize AI providers: start from the empty template and only
+        # rebuild the entries that are actually set.
         aip = config.ai_providers
+        providers = dict(_EMPTY_AIPROVIDERS_TEMPLATE)
+        if aip:
+            if aip.openai:
+                providers['openai'] = dict(aip.openai)
+            if aip.anthropic:
+                providers['anthropic'] = dict(aip.anthropic)
+            if aip.google:
+                providers['google'] = dict(aip.google)
+            if aip.huggingface:
+                providers['huggingface'] = {
+                    'api_key': aip.huggingface.api_key,
+                    'model': aip.huggingface.default_model
+                }
+            if aip.ollama:
+                providers['ollama'] = dict(aip.ollama)
         data = {
             'github': {
                 'username': config.github.username,
                 'token': config.github.token
             },
             'alias': config.alias,
-            'ai_providers': {
-                'openai': dict(aip.openai) if aip and aip.openai else None,
-                'anthropic': dict(aip.anthropic) if aip and aip.anthropic else None,
-                'google': dict(aip.google) if aip and aip.google else None,
-                'huggingface': {
-                    'api_key': aip.huggingface.api_key,
-                    'model': aip.huggingface.default_model
-                } if aip and aip.huggingface else None,
-                'ollama': dict(aip.ollama) if aip and aip.ollama else None,
-            }
+            'ai_providers': providers
         }
-        with open(self.config_file, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False)
-        self.config_file.chmod(0o600)
+        yaml, _, SafeDumper = _yaml_codec()
+        # Write-then-rename keeps the config atomic: an interrupted save
+        # can never leave a truncated file, and the single fsync before
+        # os.replace means the mtime the load cache trusts always refers
+        # to complete content. fchmod on the open fd also skips the
+        # path re-resolution a chmod-after-write would do.
+        with tempfile.NamedTemporaryFile('w', dir=self.config_dir, delete=False) as tmp:
+            os.fchmod(tmp.fileno(), 0o600)
+            yaml.dump(data, tmp, Dumper=SafeDumper, default_flow_style=False)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp.name, self.config_file)
+        self._write_sidecar(self.config_file.with_suffix('.yaml.cache.json'), data)
+        st = self.config_file.stat()
+        ConfigManager._cache[self.config_file] = (st.st_mtime, st.st_size, config)
+
+    @staticmethod
+    def _write_sidecar(cache_file: Path, data: Dict[str, Any]) -> None:
+        """Best-effort JSON mirror of the config; holds the same secrets
+        as the YAML, so it gets the same 0o600 mode."""
+        try:
+            with open(cache_file, 'w') as f:
+                json.dump(data, f)
+            cache_file.chmod(0o600)
+        except (OSError, TypeError, ValueError):
+            # TypeError/ValueError: hand-edited YAML can hold scalars
+            # json can't serialize (safe_load turns an unquoted date into
+            # datetime.date). The YAML remains the source of truth; a
+            # missing sidecar just means no fast path next load. Drop any
+            # partial write so a fresh-looking corrupt file isn't probed
+            # on every subsequent load.
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
     
     def _validate_github_credentials(self, username: str, token: str) -> bool:
-        """Validate GitHub credentials by making a test API call."""
+        """Validate GitHub credentials with a single /user request.
+
+        One GET on the pooled session replaces instantiating a PyGithub
+        client, which imports the whole library and makes its own setup
+        round-trips just to answer a yes/no question.
+        """
         try:
-            from github import Github
-            g = Github(token)
-            user = g.get_user()
-            return user.login == username
+            r = self._session().get(
+                'https://api.github.com/user',
+                headers={
+                    'Authorization': f'token {token}',
+                    'Accept': 'application/vnd.github+json',
+                },
+                timeout=10,
+            )
+            return r.status_code == 200 and r.json().get('login') == username
         except Exception as e:
             console.print(f"[red]Error validating credentials: {e}[/red]")
             return False
@@ -376,13 +548,15 @@ class ConfigManager:
         
         alias_line = f'alias {alias}="github-readme-mcp run"\n'
         
-        # Check if alias already exists
+        # Check if alias already exists, line by line so a framework-heavy
+        # rc file is never held in memory and the scan stops on first hit.
         if rc_file.exists():
+            needle = alias_line.strip()
             with open(rc_file, 'r') as f:
-                content = f.read()
-                if alias_line.strip() in content:
-                    console.print(f"[yellow]Alias '{alias}' already exists.[/yellow]")
-                    return
+                for line in f:
+                    if line.strip() == needle:
+                        console.print(f"[yellow]Alias '{alias}' already exists.[/yellow]")
+                        return
         
         # Add alias to shell rc file
         with open(rc_file, 'a') as f:
@@ -393,17 +567,20 @@ class ConfigManager:
     
     def get_github_config(self) -> GitHubConfig:
         """Get GitHub configuration."""
-        config = self.load_config()
+        # `or` skips the load_config frame entirely once loaded — these
+        # getters run per server request.
+        config = self.config or self.load_config()
         return config.github
-    
+
     def get_openai_key(self) -> Optional[str]:
         """Get OpenAI API key if configured."""
-        config = self.load_config()
-        return config.ai_providers.openai.get(config.alias)
-    
+        config = self.config or self.load_config()
+        openai = config.ai_providers.openai if config.ai_providers else None
+        return openai.get('api_key') if openai else None
+
     def update_token(self, new_token: str) -> None:
         """Update GitHub token."""
-        config = self.load_config()
+        config = self.config or self.load_config()
         config.github.token = new_token
         self.save_config(config)
         self.config = config
\ No newline at end of file
@@ -1,15 +1,80 @@
 import os
 import base64
+import re
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the fallback stays C-speed
+    np = None
+
+# Bytes considered text, built once at import instead of re-deriving the
+# set union per call. Both classification paths derive from this one
+# table so a buffer classifies identically with or without numpy.
+_TEXTCHARS = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | (set(range(0x20, 0x100)) - {0x7f})))
+
+if np is not None:
+    # Binary-byte lookup table, the complement of _TEXTCHARS: classifying
+    # a buffer becomes a single vectorized gather + any() instead of
+    # elementwise ops with boolean temporaries.
+    _CTRL_LUT = np.ones(256, dtype=bool)
+    _CTRL_LUT[np.frombuffer(_TEXTCHARS, dtype=np.uint8)] = False
 
 EXCLUDE_PATTERNS = ['.git', 'node_modules', '__pycache__', 'venv', '.DS_Store', '.mypy_cache']
+# One compiled alternation of literals scans the path once instead of
+# running a substring search per pattern.
+_EXCLUDE_RE = re.compile('|'.join(map(re.escape, EXCLUDE_PATTERNS)))
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5 MB
 
 def is_binary(content: bytes) -> bool:
-    textchars = bytearray({7,8,9,10,12,13,27} | set(range(0x20, 0x100)) - {0x7f})
-    return bool(content.translate(None, textchars))
+    """Classify content as binary by scanning for control bytes.
+
+    Only the first 8 KB is sampled (git's own heuristic). With numpy the
+    scan is one vectorized mask over the buffer; without it, the NUL
+    probe is a C-level memchr — either way no per-byte Python loop.
+    """
+    data = content[:8192]
+    # NUL is the overwhelmingly common binary signature, and the `in`
+    # operator is a single memchr over the prefix — check it first so
+    # typical binaries never reach the mask.
+    if b'\0' in data:
+        return True
+    if np is None:
+        # translate against the precomputed table: still one C pass,
+        # and unlike a bare NUL probe it catches NUL-free binaries.
+        return bool(data.translate(None, _TEXTCHARS))
+    arr = np.frombuffer(data, dtype=np.uint8)
+    return bool(_CTRL_LUT[arr].any())
 
 def should_exclude(file_path: str) -> bool:
-    return any(pattern in file_path for pattern in EXCLUDE_PATTERNS)
+    return _EXCLUDE_RE.search(file_path) is not None
+
+def is_large(entry_or_size) -> bool:
+    """Check the size limit for a DirEntry, a raw size, or a path.
+
+    DirEntry objects from os.scandir carry the stat from the directory
+    read, so passing them (or a size already in hand) avoids the extra
+    stat syscall that a path string costs.
+    """
+    if isinstance(entry_or_size, int):
+        size = entry_or_size
+    elif isinstance(entry_or_size, os.DirEntry):
+        size = entry_or_size.stat().st_size
+    else:
+        size = os.path.getsize(entry_or_size)
+    return size > MAX_FILE_SIZE
+
+def walk_repo(root):
+    """Recursively yield file DirEntry objects under `root`.
 
-def is_large(file_path: str) -> bool:
-    return os.path.getsize(file_path) > MAX_FILE_SIZE 
\ No newline at end of file
+    Skips excluded names and yields entries whose cached stat feeds
+    is_large and any metadata checks — one syscall per file instead of
+    one per check.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if should_exclude(entry.name):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_repo(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry 
\ No newline at end of file
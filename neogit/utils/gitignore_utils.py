@@ -0,0 +1,49 @@
+import hashlib
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Pooled session: repeated fetches reuse one TLS connection instead of
+# paying DNS + handshake per call.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+_CACHE_DIR = Path.home() / ".cache" / "neogit" / "gitignore"
+_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+
+
+def fetch_gitignore(techs: str) -> str:
+    """Return the gitignore.io template for `techs`.
+
+    Responses are cached on disk for a week keyed by the tech list, so
+    reruns skip the network entirely; templates change rarely.
+    """
+    cache_file = _CACHE_DIR / f"{hashlib.sha1(techs.encode()).hexdigest()}.txt"
+    try:
+        if cache_file.exists() and time.time() - cache_file.stat().st_mtime < _CACHE_TTL:
+            return cache_file.read_text(encoding='utf-8')
+    except OSError:
+        pass
+    url = f"https://www.toptal.com/developers/gitignore/api/{techs}"
+    resp = _session.get(url, timeout=10)
+    resp.raise_for_status()
+    content = resp.text
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(content, encoding='utf-8')
+    except OSError:
+        pass
+    return content
+
+
+def missing_patterns(content: str, required: list) -> list:
+    """Return the entries from `required` not already present in `content`.
+
+    Compares against whole (stripped) non-comment lines rather than raw
+    substrings, so '.env' is not falsely satisfied by an '.envrc' entry,
+    and one parse replaces a scan per pattern.
+    """
+    existing = {ln.strip() for ln in content.splitlines() if ln.strip() and not ln.startswith('#')}
+    return [p for p in required if p not in existing]
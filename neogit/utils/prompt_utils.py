@@ -1,3 +1,8 @@
+import functools
+import os
+import re
+import sys
+
 import questionary
 from rich.console import Console
 from rich.panel import Panel
@@ -16,28 +21,62 @@ DEFAULT_BANNER = '''
 [bold magenta]           N E O G I T[/bold magenta]
 '''
 
-def ascii_banner():
+@functools.lru_cache(maxsize=1)
+def _build_banner_panel():
+    # The banner is a static asset: stat, read, decode and markup-parse
+    # it once per process instead of on every interactive entry point.
     try:
         if ASCII_ART_PATH.exists():
             art = ASCII_ART_PATH.read_text(encoding="utf-8")
-            panel = Panel.fit(Text.from_markup(art), style="bold cyan", border_style="magenta")
-            console.print(panel)
-            return
+            return Panel.fit(Text.from_markup(art), style="bold cyan", border_style="magenta")
     except Exception:
         pass
-    panel = Panel.fit(Text.from_markup(DEFAULT_BANNER), style="bold cyan", border_style="magenta")
-    console.print(panel)
+    return Panel.fit(Text.from_markup(DEFAULT_BANNER), style="bold cyan", border_style="magenta")
+
+def ascii_banner():
+    console.print(_build_banner_panel())
+
+def _noninteractive():
+    """True when prompts should be answered from the environment.
+
+    Set NEOGIT_NONINTERACTIVE=1 (or run without a TTY) and every prompt
+    skips the prompt_toolkit machinery — each questionary call builds a
+    full Application just to read one value, which is tens of
+    milliseconds per prompt in scripted setups and CI.
+    """
+    flag = os.environ.get('NEOGIT_NONINTERACTIVE')
+    if flag is not None:
+        return flag == '1'
+    try:
+        return not sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+def _env_key(message):
+    """Map a prompt message to its NEOGIT_* override variable name."""
+    words = re.findall(r'[A-Za-z0-9]+', message)
+    return 'NEOGIT_' + '_'.join(w.upper() for w in words)
 
 def select_menu(message, choices):
     """Show an arrow-key menu and return the selected value."""
+    if _noninteractive():
+        value = os.environ.get(_env_key(message))
+        return value if value in choices else choices[0]
     return questionary.select(message, choices=choices, qmark="👉").ask()
 
 def confirm_menu(message, default=True):
     """Show a yes/no confirmation with emoji."""
+    if _noninteractive():
+        value = os.environ.get(_env_key(message))
+        if value is not None:
+            return value.lower() in ('1', 'true', 'yes', 'y')
+        return default
     return questionary.confirm(f"{message} 😊", default=default).ask()
 
 def text_input(message, default=None, password=False):
     """Show a text input prompt, optionally with a default and password masking."""
+    if _noninteractive():
+        return os.environ.get(_env_key(message), default)
     if password:
         return questionary.password(message, qmark="🔑").ask()
     else: